@@ -1,13 +1,16 @@
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import dspy
 import google.generativeai as genai
+import orjson
 
 from deep_research_agent.agents.subagents.llm_citation_agent import LLMCitationAgent
+from deep_research_agent.utils.text_processing import marker_scanner
 
 from ..core.logging_config import get_logger
 from ..core.memory import ResearchMemory
@@ -20,6 +23,25 @@ from .subagents.web_searcher import WebSearcher
 logger = get_logger(__name__)
 
 
+def _parse_json_response(response_text: str) -> Any:
+    """Parse the JSON object in an LLM response.
+
+    Markdown code fences and any text before or after the outermost braces are
+    removed first. Raises json.JSONDecodeError (orjson's error subclasses it)
+    if the remaining text is not valid JSON.
+    """
+    # Remove any markdown code block markers
+    response_text = (
+        response_text.strip().replace("```json", "").replace("```", "").strip()
+    )
+    # Remove any explanatory text before or after the JSON
+    if "{" in response_text and "}" in response_text:
+        start = response_text.find("{")
+        end = response_text.rfind("}") + 1
+        response_text = response_text[start:end]
+    return orjson.loads(response_text)
+
+
 class ResearchStrategy(dspy.Signature):
     """Structure for research strategy."""
 
@@ -90,22 +112,20 @@ class ResearchReport(dspy.Signature):
 
     def to_markdown(self) -> str:
         """Convert the report to markdown format."""
-        md = f"# {self.title}\n\n"
+        parts = [f"# {self.title}\n\n"]
 
         # Add all sections
         for section in self.sections:
-            md += f"## {section.title}\n\n{section.content}\n\n"
+            parts.append(f"## {section.title}\n\n{section.content}\n\n")
             if hasattr(section, "key_points") and section.key_points:
-                md += "### Key Points\n"
-                for point in section.key_points:
-                    md += f"- {point}\n"
-                md += "\n"
+                parts.append("### Key Points\n")
+                parts.extend(f"- {point}\n" for point in section.key_points)
+                parts.append("\n")
 
         # Add metadata at the end
-        md += "## Metadata\n\n"
-        for k, v in self.metadata.items():
-            md += f"- {k}: {v}\n"
-        return md
+        parts.append("## Metadata\n\n")
+        parts.extend(f"- {k}: {v}\n" for k, v in self.metadata.items())
+        return "".join(parts)
 
 
 class PlanGenerator(dspy.Module):
@@ -131,22 +151,8 @@ class PlanGenerator(dspy.Module):
         logger.info(f"Received response from LLM: {response.text[:200]}...")
 
         try:
-            import json
-
-            # Clean the response text to ensure it's valid JSON
-            response_text = response.text.strip()
-            logging.info(f"# Response text: {response_text}")
-            # Remove any markdown code block markers
-            response_text = (
-                response_text.replace("```json", "").replace("```", "").strip()
-            )
-            # Remove any explanatory text before or after the JSON
-            if "{" in response_text and "}" in response_text:
-                start = response_text.find("{")
-                end = response_text.rfind("}") + 1
-                response_text = response_text[start:end]
-            logging.info(f"# Response text: {response_text}")
-            result = json.loads(response_text)
+            logging.info(f"# Response text: {response.text.strip()}")
+            result = _parse_json_response(response.text)
             logger.info(f"Successfully parsed JSON response: {result}")
 
             # Validate the required fields
@@ -234,21 +240,7 @@ Respond with ONLY the JSON object."""
         logger.info(f"Received response from LLM: {response.text[:200]}...")
 
         try:
-            import json
-
-            # Clean the response text to ensure it's valid JSON
-            response_text = response.text.strip()
-            # Remove any markdown code block markers
-            response_text = (
-                response_text.replace("```json", "").replace("```", "").strip()
-            )
-            # Remove any explanatory text before or after the JSON
-            if "{" in response_text and "}" in response_text:
-                start = response_text.find("{")
-                end = response_text.rfind("}") + 1
-                response_text = response_text[start:end]
-
-            result = json.loads(response_text)
+            result = _parse_json_response(response.text)
             logger.info(f"Successfully parsed JSON response: {result}")
 
             # Validate the required fields
@@ -312,21 +304,7 @@ class SectionGenerator(dspy.Module):
 
         response = self.model.generate_content(prompt)
         try:
-            import json
-
-            # Clean the response text to ensure it's valid JSON
-            response_text = response.text.strip()
-            # Remove any markdown code block markers
-            response_text = (
-                response_text.replace("```json", "").replace("```", "").strip()
-            )
-            # Remove any explanatory text before or after the JSON
-            if "{" in response_text and "}" in response_text:
-                start = response_text.find("{")
-                end = response_text.rfind("}") + 1
-                response_text = response_text[start:end]
-
-            result = json.loads(response_text)
+            result = _parse_json_response(response.text)
             return ReportSection(
                 title=result.get("title", ""),
                 content=result.get("content", ""),
@@ -383,7 +361,8 @@ class LeadResearcher(dspy.Module):
         self.memory = ResearchMemory()
         self.web_searcher = WebSearcher()
         self.citation_agent = LLMCitationAgent(
-            citation_style=self.config.get("citation_style", "chicago")
+            citation_style=self.config.get("citation_style", "chicago"),
+            cache_path=self.config.get("citation_cache_path"),
         )
         self.reviewer = ReviewerAgent()
         self.template_manager = TemplateManager()
@@ -616,17 +595,28 @@ The content should be detailed and informative, suitable for a research report."
         section_texts = []  # Track all section texts
 
         # First pass: Generate all sections except References
-        for section_type in [s for s in sections_list if s != "References"]:
+        def generate_section(section_type: str) -> ReportSection:
             logger.info(f"Generating section: {section_type}")
 
             # Get analysis for this section
             analysis: Dict[str, Any] = analyses.get(section_type.lower(), {})
 
             # Generate section content
-            section = self.section_generator.forward(
+            return self.section_generator.forward(
                 topic=query, analysis=analysis, section_type=section_type
             )
 
+        # Generate sections concurrently; map() keeps the requested order
+        section_types = [s for s in sections_list if s != "References"]
+        generated_sections: List[ReportSection] = []
+        if section_types:
+            # Unset, None or 0 use the default; at least one worker
+            max_workers = max(1, int(self.config.get("max_workers") or 8))
+            max_workers = min(max_workers, len(section_types))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                generated_sections = list(executor.map(generate_section, section_types))
+
+        for section_type, section in zip(section_types, generated_sections):
             if section.content:
                 section_texts.append(section.content)
                 sections.append(section)
@@ -648,16 +638,18 @@ The content should be detailed and informative, suitable for a research report."
 
             # Split the cited text back into sections
             cited_sections = citation_result["cited_text"].split("\n\n")
+            find_citations = marker_scanner(
+                [c["text"] for c in citation_result["citations"]]
+            )
 
             # Update each section with its cited content
             for i, section in enumerate(sections):
                 if i < len(cited_sections):
                     section.content = cited_sections[i]
                     # Find citations that belong to this section
+                    present = find_citations(cited_sections[i])
                     section.citations = [
-                        c
-                        for c in citation_result["citations"]
-                        if c["text"] in cited_sections[i]
+                        c for c in citation_result["citations"] if c["text"] in present
                     ]
 
             # Add References section if it's in the sections list
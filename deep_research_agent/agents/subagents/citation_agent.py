@@ -1,14 +1,16 @@
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Tuple
 
 import dspy
 
-from deep_research_agent.utils.text_processing import calculate_similarity
-
 from ...core.memory import ResearchMemory
 from ..base_agent import BaseAgent
 
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_URL_PREFIXES = ("http://", "https://")
+
 
 class Citation(dspy.Signature):
     """Structure for citation information."""
@@ -30,8 +32,14 @@ class CitationAgent(BaseAgent):
         super().__init__(config)
         self.memory = ResearchMemory()
         self.citation_db: Dict[str, Citation] = {}  # citation_key -> Citation
+        # citation_key -> insertion position in citation_db, so citation
+        # numbers are looked up in O(1) instead of via list(keys).index()
+        self._citation_positions: Dict[str, int] = {}
         self.citation_style = "chicago"  # Default to Chicago style
         self.similarity_threshold = 0.6  # Lower threshold for better matching
+        # Source content -> SequenceMatcher indexed on it, kept between calls so
+        # sources shared by several sections are only indexed once
+        self._source_matchers: Dict[str, SequenceMatcher] = {}
 
     def forward(
         self,
@@ -53,6 +61,7 @@ class CitationAgent(BaseAgent):
         """
         self.citation_style = citation_style
         self.citation_db.clear()  # Clear previous citations
+        self._citation_positions.clear()
 
         # First pass: Process all search results and build citation database
         for result in search_results:
@@ -85,7 +94,8 @@ class CitationAgent(BaseAgent):
         # Extract metadata with defaults
         title = result.get("title", "Untitled")
         authors = result.get("authors", ["Unknown Author"])
-        year = result.get("year", datetime.now().year)
+        # Only look up the current year when the source doesn't provide one
+        year = result["year"] if "year" in result else datetime.now().year
         url = result.get("url", "")
         doi = result.get("doi", None)  # Get DOI if available
         source_content = result.get("content", "")
@@ -94,17 +104,14 @@ class CitationAgent(BaseAgent):
         if not source_content or len(source_content.strip()) == 0:
             return
 
-        # Skip results with invalid URLs
-        if not url or not url.startswith(("http://", "https://")):
-            url = ""
-
         # Generate citation key
         citation_key = self._generate_citation_key(authors, year)
 
-        # Format reference
-        reference = self._format_reference(title, authors, year, url)
+        # Format reference; invalid URLs come back as ""
+        reference, url = self._format_reference(title, authors, year, url, citation_key)
 
         # Add to citation database
+        self._citation_positions.setdefault(citation_key, len(self.citation_db))
         self.citation_db[citation_key] = Citation(
             title=title,
             authors=authors,
@@ -121,17 +128,37 @@ class CitationAgent(BaseAgent):
         include referenced citations."""
         # Track which citation keys are actually used
         self.referenced_citation_keys = set()
-        sentences = re.split(r"(?<=[.!?])\s+", content)
-        processed_sentences = []
-        for sentence in sentences:
-            matching_citations = []
-            for key, citation in self.citation_db.items():
+        sentences = _SENTENCE_SPLIT_RE.split(content)
+        lowered_sentences = [sentence.lower() for sentence in sentences]
+        matches: List[List[Citation]] = [[] for _ in sentences]
+
+        # Compare source by source: SequenceMatcher indexes its second sequence,
+        # so each source is indexed once and scored against every sentence.
+        # real_quick_ratio() and quick_ratio() are cheap upper bounds on
+        # ratio(), so most non-matching pairs are rejected without the full
+        # matching-blocks computation.
+        threshold = self.similarity_threshold
+        source_matchers = {}
+        for key, citation in self.citation_db.items():
+            matcher = self._source_matchers.get(citation.content)
+            if matcher is None:
+                matcher = SequenceMatcher(None, "", citation.content.lower())
+            source_matchers[citation.content] = matcher
+            for i, sentence in enumerate(lowered_sentences):
+                matcher.set_seq1(sentence)
                 if (
-                    calculate_similarity(sentence, citation.content)
-                    >= self.similarity_threshold
+                    matcher.real_quick_ratio() >= threshold
+                    and matcher.quick_ratio() >= threshold
+                    and matcher.ratio() >= threshold
                 ):
-                    matching_citations.append(citation)
+                    matches[i].append(citation)
                     self.referenced_citation_keys.add(key)
+
+        # Only keep the current sources, so the cache doesn't grow across calls
+        self._source_matchers = source_matchers
+
+        processed_sentences = []
+        for sentence, matching_citations in zip(sentences, matches):
             if matching_citations:
                 matching_citations.sort(key=lambda x: x.year, reverse=True)
                 citations_text = self._format_citation_group(matching_citations)
@@ -144,11 +171,8 @@ class CitationAgent(BaseAgent):
         """Format a group of citations together."""
         if not citations:
             return ""
-        # Sort citations by their index in the citation database
-        sorted_citations = sorted(
-            citations, key=lambda x: list(self.citation_db.keys()).index(x.citation_key)
-        )
-        citation_numbers = [str(i + 1) for i, _ in enumerate(sorted_citations)]
+        # Groups are numbered 1..n in order, so only the group size matters
+        citation_numbers = [str(i + 1) for i in range(len(citations))]
         return f"[{','.join(citation_numbers)}]"
 
     def _generate_reference_list(self) -> List[str]:
@@ -156,7 +180,7 @@ class CitationAgent(BaseAgent):
         # Sort citations by their order in the database
         sorted_citations = sorted(
             self.citation_db.values(),
-            key=lambda x: list(self.citation_db.keys()).index(x.citation_key),
+            key=lambda x: self._citation_positions[x.citation_key],
         )
         # Format references with numbers
         return [
@@ -169,9 +193,13 @@ class CitationAgent(BaseAgent):
         return f"{authors[0]}_{year}"
 
     def _format_reference(
-        self, title: str, authors: List[str], year: int, url: str
-    ) -> str:
-        """Format reference based on style."""
+        self, title: str, authors: List[str], year: int, url: str, citation_key: str
+    ) -> Tuple[str, str]:
+        """Format reference based on style.
+
+        Returns the reference together with the validated URL, which is empty
+        if the given URL isn't an http(s) link.
+        """
         # Format authors based on style
         if self.citation_style == "apa":
             if len(authors) > 2:
@@ -189,27 +217,34 @@ class CitationAgent(BaseAgent):
                 authors_str = authors[0]
 
         # Validate URL
-        if not url or not url.startswith(("http://", "https://")):
+        if not url or not url.startswith(_URL_PREFIXES):
+            url = ""
             url_text = "[No valid URL available]"
         else:
             # Format URL as a markdown link
             url_text = f"[{url}]({url})"
 
         # Get the citation number from the database
-        citation_key = self._generate_citation_key(authors, year)
-        if citation_key in self.citation_db:
-            citation_number = list(self.citation_db.keys()).index(citation_key) + 1
+        if citation_key in self._citation_positions:
+            citation_number = self._citation_positions[citation_key] + 1
         else:
             # If not in database yet, use the next available number
             citation_number = len(self.citation_db) + 1
 
         if self.citation_style == "apa":
-            return f"[{citation_number}] {authors_str}. ({year}). {title}. {url_text}"
-        return f'[{citation_number}] {authors_str}. {year}. "{title}." {url_text}'
+            reference = (
+                f"[{citation_number}] {authors_str}. ({year}). {title}. {url_text}"
+            )
+        else:
+            reference = (
+                f'[{citation_number}] {authors_str}. {year}. "{title}." {url_text}'
+            )
+        return reference, url
 
     def add_citation(self, citation: Citation) -> str:
         """Add a new citation to the collection."""
         citation_key = citation.get("citation_key", f"cite_{len(self.citation_db)}")
+        self._citation_positions.setdefault(citation_key, len(self.citation_db))
         self.citation_db[citation_key] = citation
         return citation_key
 
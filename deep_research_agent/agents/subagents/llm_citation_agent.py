@@ -1,15 +1,20 @@
 import json
 import os
 import re
-from typing import Any, Dict, List, Optional
-
-import google.generativeai as genai
+from typing import Any, Dict, List, Optional, Set
 
 from ...core.logging_config import get_logger
+from ...utils.cache import DiskCache
 
 # Get logger
 logger = get_logger(__name__)
 
+# Numeric in-text citations such as [1] or [2, 3]
+_CITATION_RE = re.compile(r"\[(\d+(?:\s*,\s*\d+)*)\]")
+
+# Version of the citation prompt, part of every citation cache key
+CITATION_CACHE_VERSION = "1"
+
 
 class LLMCitationAgent:
     """
@@ -17,10 +22,22 @@ class LLMCitationAgent:
     Uses Gemini Pro for improved citation handling.
     """
 
-    def __init__(self, llm=None, citation_style: str = "chicago"):
+    def __init__(
+        self,
+        llm=None,
+        citation_style: str = "chicago",
+        cache_path: Optional[str] = None,
+    ):
         # Initialize with Gemini Pro if no model provided
-        self.llm = llm or genai.GenerativeModel(os.getenv("LLM_MODEL", "gemini-pro"))
+        if not llm:
+            # Only needed for the default model
+            import google.generativeai as genai
+
+            llm = genai.GenerativeModel(os.getenv("LLM_MODEL", "gemini-pro"))
+        self.llm = llm
         self.citation_style = citation_style
+        # Optional on-disk cache of LLM responses keyed by prompt hash
+        self.cache = DiskCache(cache_path, CITATION_CACHE_VERSION, "citation")
         logger.info(
             f"Initialized LLMCitationAgent with citation style: {citation_style}"
         )
@@ -97,26 +114,38 @@ Remember:
 """
         logger.debug(f"Generated prompt:\n{prompt}")
 
-        try:
-            response = self.llm.generate_content(prompt)
-            logger.info("Successfully received response from Gemini Pro")
-            logger.debug(
-                f"LLM response:\n{response.text[:500]}..."
-            )  # Log first 500 chars of response
-        except Exception as e:
-            logger.error(f"Error getting response from Gemini Pro: {str(e)}")
-            raise
-
-        cited_text = response.text.strip()
-
-        # Extract the References section
-        if "## References" in cited_text:
-            cited_text = cited_text.split("## References")[0].strip()
+        # Reuse a previous response to the exact same prompt if cached; the
+        # references are formatted below, so one entry serves every style
+        cache_key = self.cache.key(str(getattr(self.llm, "model_name", "")), prompt)
+        response_text = self.cache.get(cache_key)
+        if response_text is not None:
+            logger.info("Using cached citation response")
+        else:
+            try:
+                response = self.llm.generate_content(prompt)
+                response_text = response.text
+                logger.info("Successfully received response from Gemini Pro")
+                logger.debug(
+                    f"LLM response:\n{response_text[:500]}..."
+                )  # Log first 500 chars of response
+            except Exception as e:
+                logger.error(f"Error getting response from Gemini Pro: {str(e)}")
+                raise
+            self.cache.set(cache_key, response_text)
+
+        cited_text = response_text.strip()
+
+        # Extract the References section; partition stops at the first header
+        # instead of splitting the whole references tail into a list
+        body, found, _ = cited_text.partition("## References")
+        if found:
+            cited_text = body.strip()
             logger.info("Successfully extracted References section")
         else:
             logger.warning("No References section found in Gemini Pro response")
 
         # Format citations with both text and reference fields
+        is_apa = citation_style == "apa"
         citations = []
         for i, s in enumerate(sources):
             authors = ", ".join(s.get("authors", ["Unknown Author"]))
@@ -129,12 +158,12 @@ Remember:
 
             # Format the reference with proper URL handling
             if url:
-                if citation_style == "apa":
+                if is_apa:
                     reference = f"{authors}. ({year}). {title}. {url}"
                 else:  # chicago
                     reference = f'{authors}. {year}. "{title}." {url}'
             else:
-                if citation_style == "apa":
+                if is_apa:
                     reference = f"{authors}. ({year}). {title}."
                 else:  # chicago
                     reference = f'{authors}. {year}. "{title}."'
@@ -145,24 +174,24 @@ Remember:
             logger.debug(f"Formatted citation: {text} -> {reference}")
 
         # Validate that all citations in the text have corresponding references
-        citation_pattern = r"\[(\d+(?:\s*,\s*\d+)*)\]"
-        found_citations = []
-        for match in re.finditer(citation_pattern, cited_text):
-            citation_text = match.group(0)
+        # Cited numbers are collected in a set, so the membership checks below
+        # are O(1) however often a source is cited
+        found_citations: Set[int] = set()
+        for match in _CITATION_RE.finditer(cited_text):
             # Extract citation numbers
-            numbers = [int(n) for n in match.group(1).split(",")]
-            found_citations.extend(numbers)
+            found_citations.update(int(n) for n in match.group(1).split(","))
 
         # Filter citations to only include those that are actually used in the text
         used_citations = [c for c in citations if int(c["id"]) in found_citations]
 
-        formatted_references = ""
         # Format references section with only used citations
         # Sort used citations by their numeric ID
         used_citations.sort(key=lambda x: int(x["id"]))
-        for citation in used_citations:
-            # Format reference with number at the start
-            formatted_references += f"[{citation['id']}] {citation['reference']}\n\n"
+        # Format each reference with its number at the start
+        formatted_references = "".join(
+            f"[{citation['id']}] {citation['reference']}\n\n"
+            for citation in used_citations
+        )
 
         logger.info(f"Generated {len(used_citations)} citations")
         logger.debug(f"Final references section:\n{formatted_references}")
@@ -174,7 +203,7 @@ Remember:
 
         # Check for duplicate citations
         citation_counts: Dict[str, int] = {}
-        for match in re.finditer(citation_pattern, cited_text):
+        for match in _CITATION_RE.finditer(cited_text):
             citation_text = match.group(0)
             citation_counts[citation_text] = citation_counts.get(citation_text, 0) + 1
             if citation_counts[citation_text] > 1:
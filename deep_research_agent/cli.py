@@ -56,6 +56,11 @@ def parse_args():
         default=0.6,
         help="Similarity threshold for citation matching (default: 0.6)",
     )
+    parser.add_argument(
+        "--citation-cache",
+        type=str,
+        help="Path to an on-disk cache of citation responses to reuse across runs",
+    )
     parser.add_argument(
         "--artifacts-dir",
         type=str,
@@ -96,6 +101,7 @@ def generate_report(args):
         config={
             "citation_style": args.citation_style,
             "citation_threshold": args.citation_threshold,
+            "citation_cache_path": getattr(args, "citation_cache", None),
         }
     )
     artifact_evaluator = ArtifactEvaluator(artifacts_dir=args.artifacts_dir)
@@ -176,6 +182,7 @@ def main():
         config={
             "citation_style": args.citation_style,
             "citation_threshold": args.citation_threshold,
+            "citation_cache_path": getattr(args, "citation_cache", None),
         }
     )
     artifact_evaluator = ArtifactEvaluator(artifacts_dir=args.artifacts_dir)
@@ -4,6 +4,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +46,13 @@ class ArtifactEvaluator:
         filename = f"research_artifacts_{timestamp}.json"
         filepath = self.artifacts_dir / filename
 
+        # Collect section titles and citation counts in a single pass
+        section_titles = []
+        total_citations = 0
+        for section in report["sections"]:
+            section_titles.append(section["title"])
+            total_citations += len(section.get("citations", []))
+
         # Prepare artifacts data
         artifacts = {
             "timestamp": timestamp,
@@ -55,10 +64,8 @@ class ArtifactEvaluator:
             "metadata": {
                 "total_search_results": len(search_results),
                 "topics_analyzed": list(analyses.keys()),
-                "report_sections": [s["title"] for s in report["sections"]],
-                "total_citations": sum(
-                    len(s.get("citations", [])) for s in report["sections"]
-                ),
+                "report_sections": section_titles,
+                "total_citations": total_citations,
             },
         }
 
@@ -82,8 +89,8 @@ class ArtifactEvaluator:
             Dict[str, Any]: Loaded artifacts
         """
         try:
-            with open(filepath, "r") as f:
-                artifacts = json.load(f)
+            with open(filepath, "rb") as f:
+                artifacts = orjson.loads(f.read())
             logger.info(f"Loaded research artifacts from {filepath}")
             return artifacts
         except Exception as e:
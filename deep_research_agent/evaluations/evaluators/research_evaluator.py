@@ -5,11 +5,16 @@ from typing import Any, Dict, List, Optional
 import dspy
 import google.generativeai as genai
 
+from ...utils.cache import DiskCache
 from ..base_evaluator import BaseEvaluator, EvaluationMetrics
 from ..metrics import ResearchMetrics
 
 logger = logging.getLogger(__name__)
 
+# Bump when the prompt parsing or metrics mapping changes so that cached
+# evaluations from older versions are not reused.
+EVALUATION_CACHE_VERSION = "1"
+
 
 class ResearchEvaluation(dspy.Signature):
     """Structure for research evaluation results."""
@@ -38,9 +43,14 @@ class ResearchEvaluator(BaseEvaluator):
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
-        self.model = genai.GenerativeModel(os.getenv("LLM_MODEL", "gemini-pro"))
+        self.model_name = os.getenv("LLM_MODEL", "gemini-pro")
+        self.model = genai.GenerativeModel(self.model_name)
         self.metrics = ResearchMetrics()
         self.quality_threshold = config.get("quality_threshold", 0.7) if config else 0.7
+        # Optional on-disk cache of evaluation results keyed by prompt hash
+        self.cache = DiskCache(
+            self.config.get("cache_path"), EVALUATION_CACHE_VERSION, "evaluation"
+        )
 
     def evaluate(
         self,
@@ -54,6 +64,13 @@ class ResearchEvaluator(BaseEvaluator):
         # Prepare evaluation prompt
         prompt = self._create_evaluation_prompt(research_output, ground_truth, context)
 
+        # Reuse a previous evaluation of the exact same prompt if cached
+        cache_key = self.cache.key(self.model_name, prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached evaluation result")
+            return EvaluationMetrics(**cached)
+
         # Get LLM evaluation
         try:
             response = self.model.generate_content(prompt)
@@ -74,6 +91,7 @@ class ResearchEvaluator(BaseEvaluator):
                 },
             )
 
+            self.cache.set(cache_key, metrics.model_dump())
             return metrics
 
         except Exception as e:
@@ -0,0 +1,84 @@
+"""
+Formatting of saved research reports and evaluation summaries.
+"""
+import io
+from typing import Any, Dict, List
+
+
+def _format_citation(citation: Any) -> str:
+    """Format a citation line, handling both old and new citation formats."""
+    if isinstance(citation, dict):
+        if "reference" in citation:
+            return f"- {citation['text']}: {citation['reference']}"
+        if "source" in citation:
+            return f"- {citation['text']}: {citation['source']}"
+        return f"- {citation['text']}"
+    return f"- {citation}"
+
+
+def _format_citations(citations: List[Any]) -> str:
+    """Format a section's citations, one per line."""
+    # Sections written by the citation agents hold only "reference" dicts, so
+    # check the first one and format the rest without per-citation dispatch;
+    # a section that mixes formats raises and takes the general path
+    first = citations[0]
+    if isinstance(first, dict) and "reference" in first:
+        try:
+            return "\n".join([f"- {c['text']}: {c['reference']}" for c in citations])
+        except (KeyError, TypeError):
+            pass
+    return "\n".join([_format_citation(citation) for citation in citations])
+
+
+def format_report_for_evaluation(report: Dict[str, Any]) -> str:
+    """
+    Format a report dictionary (as stored in research artifacts) as markdown.
+
+    Args:
+        report: Report with 'title' and 'sections' (title, content,
+            key_points, citations)
+
+    Returns:
+        str: Markdown text passed to the evaluator
+    """
+    buf = io.StringIO()
+    write = buf.write
+
+    write(f"# {report['title']}\n")
+    for section in report["sections"]:
+        # Assemble each section's parts and write them in one call
+        parts = [f"\n## {section['title']}\n\n{section['content']}"]
+        if section["key_points"]:
+            parts.append("\n\nKey Points:\n")
+            parts.append("\n".join([f"- {point}" for point in section["key_points"]]))
+        if section["citations"]:
+            parts.append(f"\n\nCitations:\n{_format_citations(section['citations'])}")
+        parts.append("\n\n")
+        write("".join(parts))
+
+    return buf.getvalue()
+
+
+def is_metric_value(value: Any) -> bool:
+    """Return True for values reported as table/CSV metric columns, bools included."""
+    return isinstance(value, (int, float))
+
+
+def is_numeric(value: Any) -> bool:
+    """Return True for int/float values, excluding bools."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def markdown_table(headers: List[str], rows: List[Dict[str, Any]]) -> str:
+    """Render rows as a GitHub-flavored markdown table."""
+
+    def cell(value: Any) -> str:
+        return str(value).replace("|", "\\|")
+
+    header = "| " + " | ".join([cell(h) for h in headers]) + " |"
+    separator = "|" + "|".join(["---"] * len(headers)) + "|"
+    body = [
+        "| " + " | ".join([cell(row.get(h, "")) for h in headers]) + " |"
+        for row in rows
+    ]
+    return "\n".join([header, separator, *body])
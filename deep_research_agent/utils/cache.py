@@ -0,0 +1,55 @@
+"""
+On-disk cache for results of expensive LLM calls.
+"""
+import hashlib
+import logging
+import shelve
+import threading
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """Thread-safe shelve cache keyed by a hash of the inputs that produced a value.
+
+    A cache without a path is disabled: lookups miss and stores are dropped.
+    Read and write errors are logged and treated the same way, so a broken
+    cache file never fails the caller.
+    """
+
+    def __init__(self, path: Optional[str], version: str, name: str = "cache"):
+        self.path = path
+        # Part of every key, so entries written by older versions aren't reused
+        self.version = version
+        self.name = name
+        self._lock = threading.Lock()
+
+    def key(self, *parts: str) -> str:
+        """Hash the version and the given parts into a cache key."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.version, *parts):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for the key, or None on a miss."""
+        if not self.path:
+            return None
+        try:
+            with self._lock, shelve.open(self.path) as cache:
+                return cache.get(key)
+        except Exception as e:
+            logger.warning(f"Could not read {self.name} cache: {str(e)}")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value under the key."""
+        if not self.path:
+            return
+        try:
+            with self._lock, shelve.open(self.path) as cache:
+                cache[key] = value
+        except Exception as e:
+            logger.warning(f"Could not write {self.name} cache: {str(e)}")
@@ -1,4 +1,13 @@
+"""
+Utility functions for the deep research agent.
+"""
+import re
 from difflib import SequenceMatcher
+from typing import Callable, Sequence, Set
+
+# Below this many markers, per-marker substring checks are cheaper than
+# compiling a combined pattern.
+MARKER_SCAN_THRESHOLD = 64
 
 
 def calculate_similarity(text1: str, text2: str) -> float:
@@ -13,3 +22,28 @@ def calculate_similarity(text1: str, text2: str) -> float:
         float: Similarity score between 0 and 1
     """
     return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+
+
+def marker_scanner(markers: Sequence[str]) -> Callable[[str], Set[str]]:
+    """
+    Build a function that returns which of the given markers occur in a text.
+
+    For large marker sets the markers are compiled once into a single
+    alternation pattern, so each text is scanned in one pass instead of once
+    per marker. Markers are expected not to contain one another (as with
+    numeric citations like "[1]", "[12]").
+
+    Args:
+        markers: Literal strings to look for (e.g. in-text citations)
+
+    Returns:
+        Callable[[str], Set[str]]: Maps a text to the set of markers found in it
+    """
+    unique = list(dict.fromkeys(markers))
+    if len(unique) < MARKER_SCAN_THRESHOLD:
+        return lambda text: {m for m in unique if m in text}
+
+    pattern = re.compile(
+        "|".join(re.escape(m) for m in sorted(unique, key=len, reverse=True))
+    )
+    return lambda text: set(pattern.findall(text))
@@ -1,10 +1,10 @@
+import csv
 import json
 from datetime import datetime
 from pathlib import Path
+from statistics import fmean
 from typing import Any, Dict, List
 
-import pandas as pd
-
 from deep_research_agent.cli import generate_report
 from deep_research_agent.core.logging_config import get_logger, setup_logging
 from deep_research_agent.evaluations.evaluators.artifact_evaluator import (
@@ -13,6 +13,12 @@ from deep_research_agent.evaluations.evaluators.artifact_evaluator import (
 from deep_research_agent.evaluations.evaluators.research_evaluator import (
     ResearchEvaluator,
 )
+from deep_research_agent.formatting import (
+    format_report_for_evaluation,
+    is_metric_value,
+    is_numeric,
+    markdown_table,
+)
 
 # Set up logging
 setup_logging(log_level="INFO", log_dir="logs")
@@ -105,7 +111,7 @@ class BatchProcessor:
 
         # Format report for evaluation
         report = artifacts["report"]
-        formatted_report = self._format_report_for_evaluation(report)
+        formatted_report = format_report_for_evaluation(report)
 
         # Prepare context
         context = {
@@ -126,23 +132,26 @@ class BatchProcessor:
                 context=context,
             )
 
-            # Convert metrics to dict, handling non-numeric values
-            metrics_dict: Dict[str, Any] = {
+            # Keep numeric additional metrics, converting the rest to strings
+            additional = metrics.additional_metrics
+            numeric_metrics = {
+                key: value
+                for key, value in additional.items()
+                if is_metric_value(value)
+            }
+            text_metrics = {
+                f"{key}_text": str(value)
+                for key, value in additional.items()
+                if not is_metric_value(value)
+            }
+
+            return {
                 "accuracy": metrics.accuracy,
                 "relevance": metrics.relevance,
                 "coherence": metrics.coherence,
-                "additional_metrics": {},
+                "additional_metrics": {**numeric_metrics, **text_metrics},
             }
 
-            # Process additional metrics, converting non-numeric values to strings
-            for key, value in metrics.additional_metrics.items():
-                if isinstance(value, (int, float)):
-                    metrics_dict["additional_metrics"][key] = value
-                else:
-                    metrics_dict["additional_metrics"][f"{key}_text"] = str(value)
-
-            return metrics_dict
-
         except Exception as e:
             logger.error(f"Error evaluating report: {str(e)}")
             return {
@@ -152,42 +161,6 @@ class BatchProcessor:
                 "additional_metrics": {"error": str(e)},
             }
 
-    def _format_report_for_evaluation(self, report: Dict[str, Any]) -> str:
-        """Format the report for evaluation."""
-        sections = []
-
-        # Add title
-        sections.append(f"# {report['title']}\n")
-
-        # Add each section
-        for section in report["sections"]:
-            sections.append(f"## {section['title']}\n")
-            sections.append(section["content"])
-            if section["key_points"]:
-                sections.append("\nKey Points:")
-                for point in section["key_points"]:
-                    sections.append(f"- {point}")
-            if section["citations"]:
-                sections.append("\nCitations:")
-                for citation in section["citations"]:
-                    # Handle both old and new citation formats
-                    if isinstance(citation, dict):
-                        if "reference" in citation:
-                            sections.append(
-                                f"- {citation['text']}: {citation['reference']}"
-                            )
-                        elif "source" in citation:
-                            sections.append(
-                                f"- {citation['text']}: {citation['source']}"
-                            )
-                        else:
-                            sections.append(f"- {citation['text']}")
-                    else:
-                        sections.append(f"- {citation}")
-            sections.append("\n")
-
-        return "\n".join(sections)
-
     def generate_evaluation_report(self, results: List[Dict[str, Any]]) -> None:
         """Generate a summary report of all evaluations."""
         # Filter results with evaluations
@@ -197,7 +170,7 @@ class BatchProcessor:
             logger.warning("No evaluations to report on!")
             return
 
-        # Create summary DataFrame
+        # Build one summary row per evaluated report
         summary_data = []
         for result in evaluated_results:
             eval_data = result["evaluation"]
@@ -211,22 +184,28 @@ class BatchProcessor:
             }
 
             # Add additional metrics that are numeric
-            for key, value in eval_data["additional_metrics"].items():
-                if isinstance(value, (int, float)):
-                    row_data[key] = value
+            row_data.update(
+                {
+                    key: value
+                    for key, value in eval_data["additional_metrics"].items()
+                    if is_metric_value(value)
+                }
+            )
 
             summary_data.append(row_data)
 
-        df = pd.DataFrame(summary_data)
+        # Columns in first-seen order; rows may carry different extra metrics
+        headers = list(dict.fromkeys(key for row in summary_data for key in row))
 
         # Calculate statistics for numeric columns only
-        numeric_cols = df.select_dtypes(include=["float64", "int64"]).columns
-        stats = {}
-        for col in numeric_cols:
-            stats[f"Mean {col}"] = df[col].mean()
-            stats[f"Best {col}"] = df[col].max()
+        stats: Dict[str, Any] = {}
+        for col in headers:
+            values = [row[col] for row in summary_data if col in row]
+            if all(is_numeric(value) for value in values):
+                stats[f"Mean {col}"] = fmean(values)
+                stats[f"Best {col}"] = max(values)
 
-        stats["Total Reports"] = len(df)
+        stats["Total Reports"] = len(summary_data)
 
         # Save summary report
         summary_path = self.evaluations_dir / "evaluation_summary.md"
@@ -234,13 +213,13 @@ class BatchProcessor:
             f.write("# Evaluation Summary\n\n")
             f.write("## Statistics\n\n")
             for key, value in stats.items():
-                if isinstance(value, (int, float)):
+                if is_numeric(value):
                     f.write(f"- {key}: {value:.3f}\n")
                 else:
                     f.write(f"- {key}: {value}\n")
 
             f.write("\n## Detailed Results\n\n")
-            f.write(df.to_markdown(index=False))
+            f.write(markdown_table(headers, summary_data))
 
             # Add non-numeric feedback
             f.write("\n## Additional Feedback\n\n")
@@ -248,12 +227,15 @@ class BatchProcessor:
                 eval_data = result["evaluation"]
                 f.write(f"### {result['query']}\n\n")
                 for key, value in eval_data["additional_metrics"].items():
-                    if not isinstance(value, (int, float)):
+                    if not is_metric_value(value):
                         f.write(f"- {key}: {value}\n")
                 f.write("\n")
 
         # Save detailed results as CSV
-        df.to_csv(self.evaluations_dir / "detailed_results.csv", index=False)
+        with open(self.evaluations_dir / "detailed_results.csv", "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=headers)
+            writer.writeheader()
+            writer.writerows(summary_data)
 
         logger.info(f"\nEvaluation summary saved to: {summary_path}")
         logger.info(
@@ -1,26 +1,91 @@
-import json
+import csv
+import functools
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from statistics import fmean
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import pandas as pd
+import orjson
 
 from deep_research_agent.evaluations.evaluators.artifact_evaluator import (
     ArtifactEvaluator,
 )
-from deep_research_agent.evaluations.evaluators.research_evaluator import (
-    ResearchEvaluator,
+from deep_research_agent.formatting import (
+    format_report_for_evaluation,
+    is_metric_value,
+    is_numeric,
+    markdown_table,
 )
 
+if TYPE_CHECKING:
+    from deep_research_agent.evaluations.evaluators.research_evaluator import (
+        ResearchEvaluator,
+    )
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def get_research_evaluator(cache_path: Optional[str] = None) -> "ResearchEvaluator":
+    """Return the shared ResearchEvaluator for cache_path, creating it on first use.
+
+    The evaluator is thread-safe for evaluate() calls, so one instance (and its
+    model client) is shared by every worker and every ExistingEvaluator.
+    """
+    # Deferred so --help and empty batches skip loading dspy
+    from deep_research_agent.evaluations.evaluators.research_evaluator import (
+        ResearchEvaluator,
+    )
+
+    return ResearchEvaluator(config={"cache_path": cache_path} if cache_path else None)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_for_evaluation(
+    artifact_evaluator: ArtifactEvaluator, artifacts_path: str, mtime: float
+) -> Tuple[Dict[str, Any], str]:
+    """Load an artifacts file and format its report for evaluation.
+
+    Cached per file path and modification time, so reports that share an
+    artifacts file only load and format it once. Callers must treat the
+    returned artifacts as read-only.
+    """
+    artifacts = artifact_evaluator.load_artifacts(artifacts_path)
+    return artifacts, format_report_for_evaluation(artifacts["report"])
+
+
+def _list_files(directory: Path, suffix: str) -> List[str]:
+    """Return the paths of the files in directory ending with suffix.
+
+    Uses os.scandir, which yields paths as strings without a per-entry
+    Path/fnmatch round trip. A missing directory has no files.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.path for entry in entries if entry.name.endswith(suffix)]
+    except FileNotFoundError:
+        return []
+
+
 class ExistingEvaluator:
-    def __init__(self, batch_dir: str):
-        """Initialize evaluator with batch output directory."""
+    def __init__(
+        self,
+        batch_dir: str,
+        cache_path: Optional[str] = None,
+        max_workers: int = 8,
+    ):
+        """Initialize evaluator with batch output directory.
+
+        If cache_path is given, evaluation results are cached on disk there
+        and reused when the same report is evaluated again. Up to max_workers
+        reports (at least one) are evaluated concurrently.
+        """
         self.batch_dir = Path(batch_dir)
+        self.max_workers = max(1, max_workers)
         self.reports_dir = self.batch_dir / "reports"
         self.artifacts_dir = self.batch_dir / "artifacts"
         self.evaluations_dir = self.batch_dir / "evaluations"
@@ -28,58 +93,26 @@ class ExistingEvaluator:
         # Create evaluations directory if it doesn't exist
         self.evaluations_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize evaluators
-        self.research_evaluator = ResearchEvaluator()
+        # Initialize evaluators; the research evaluator is created on first use
+        # and shared between instances
+        self.cache_path = cache_path
         self.artifact_evaluator = ArtifactEvaluator(
             artifacts_dir=str(self.artifacts_dir)
         )
 
-    def _format_report_for_evaluation(self, report: Dict[str, Any]) -> str:
-        """Format the report for evaluation."""
-        sections = []
-
-        # Add title
-        sections.append(f"# {report['title']}\n")
-
-        # Add each section
-        for section in report["sections"]:
-            sections.append(f"## {section['title']}\n")
-            sections.append(section["content"])
-            if section["key_points"]:
-                sections.append("\nKey Points:")
-                for point in section["key_points"]:
-                    sections.append(f"- {point}")
-            if section["citations"]:
-                sections.append("\nCitations:")
-                for citation in section["citations"]:
-                    # Handle both old and new citation formats
-                    if isinstance(citation, dict):
-                        if "reference" in citation:
-                            sections.append(
-                                f"- {citation['text']}: {citation['reference']}"
-                            )
-                        elif "source" in citation:
-                            sections.append(
-                                f"- {citation['text']}: {citation['source']}"
-                            )
-                        else:
-                            sections.append(f"- {citation['text']}")
-                    else:
-                        sections.append(f"- {citation}")
-            sections.append("\n")
-
-        return "\n".join(sections)
+    @property
+    def research_evaluator(self) -> "ResearchEvaluator":
+        return get_research_evaluator(self.cache_path)
 
     def _evaluate_report(
         self, report_path: str, artifacts_path: str, ground_truth: str
     ) -> Dict[str, Any]:
         """Evaluate a single report."""
-        # Load artifacts
-        artifacts = self.artifact_evaluator.load_artifacts(artifacts_path)
-
-        # Format report for evaluation
+        # Load artifacts and format report for evaluation
+        artifacts, formatted_report = _load_for_evaluation(
+            self.artifact_evaluator, artifacts_path, os.path.getmtime(artifacts_path)
+        )
         report = artifacts["report"]
-        formatted_report = self._format_report_for_evaluation(report)
 
         # Prepare context
         context = {
@@ -100,23 +133,26 @@ class ExistingEvaluator:
                 context=context,
             )
 
-            # Convert metrics to dict, handling non-numeric values
-            metrics_dict: Dict[str, Any] = {
+            # Keep numeric additional metrics, converting the rest to strings
+            additional = metrics.additional_metrics
+            numeric_metrics = {
+                key: value
+                for key, value in additional.items()
+                if is_metric_value(value)
+            }
+            text_metrics = {
+                f"{key}_text": str(value)
+                for key, value in additional.items()
+                if not is_metric_value(value)
+            }
+
+            return {
                 "accuracy": metrics.accuracy,
                 "relevance": metrics.relevance,
                 "coherence": metrics.coherence,
-                "additional_metrics": {},
+                "additional_metrics": {**numeric_metrics, **text_metrics},
             }
 
-            # Process additional metrics, converting non-numeric values to strings
-            for key, value in metrics.additional_metrics.items():
-                if isinstance(value, (int, float)):
-                    metrics_dict["additional_metrics"][key] = value
-                else:
-                    metrics_dict["additional_metrics"][f"{key}_text"] = str(value)
-
-            return metrics_dict
-
         except Exception as e:
             logger.error(f"Error evaluating report: {str(e)}")
             return {
@@ -129,51 +165,86 @@ class ExistingEvaluator:
     def evaluate_reports(self, ground_truth_file: str) -> None:
         """Evaluate all reports in the batch directory."""
         # Load ground truth
-        with open(ground_truth_file, "r") as f:
-            ground_truth_data = json.load(f)
+        with open(ground_truth_file, "rb") as f:
+            ground_truth_data = orjson.loads(f.read())
 
         # Get all artifact files
-        artifact_files = list(self.artifacts_dir.glob("*.json"))
+        artifact_files = _list_files(self.artifacts_dir, ".json")
         if not artifact_files:
             logger.error("No artifact files found!")
             return
 
-        # Process each report
-        results = []
-        for report_path in self.reports_dir.glob("*.md"):
+        # Lowercase the ground-truth queries once, not once per report, and
+        # remember each report query's match so repeated queries scan once
+        ground_truth_pairs = [
+            (item["query"].lower(), item) for item in ground_truth_data["queries"]
+        ]
+        matched_items: Dict[str, Optional[Dict[str, Any]]] = {}
+
+        # Match each report to its ground truth
+        pending = []
+        for report_path in _list_files(self.reports_dir, ".md"):
             # Use the first artifact file if we can't match by query
             artifacts_path = artifact_files[0]
             logger.info(f"Using artifact file: {artifacts_path}")
 
             # Get ground truth for this query
-            query = report_path.stem.split("_")[1]  # Extract query from filename
+            # Query from filename
+            query = Path(report_path).stem.split("_")[1]
             ground_truth = None
 
             # Try to find a matching ground truth by checking if the query is substring
-            for item in ground_truth_data["queries"]:
-                if query.lower() in item["query"].lower():
-                    ground_truth = item.get("ground_truth")
-                    logger.info(f"Found ground truth for query: {item['query']}")
-                    break
+            query_lower = query.lower()
+            if query_lower not in matched_items:
+                matched_items[query_lower] = next(
+                    (
+                        item
+                        for item_query, item in ground_truth_pairs
+                        if query_lower in item_query
+                    ),
+                    None,
+                )
+            item = matched_items[query_lower]
+            if item is not None:
+                ground_truth = item.get("ground_truth")
+                logger.info(f"Found ground truth for query: {item['query']}")
 
             if not ground_truth:
                 logger.warning(f"No ground truth found for query: {query}")
                 continue
 
-            logger.info(f"\nEvaluating report: {report_path}")
-            evaluation = self._evaluate_report(
-                str(report_path), str(artifacts_path), ground_truth
-            )
-
-            results.append(
+            pending.append(
                 {
                     "query": query,
-                    "report_path": str(report_path),
-                    "artifacts_path": str(artifacts_path),
-                    "evaluation": evaluation,
+                    "report_path": report_path,
+                    "artifacts_path": artifacts_path,
+                    "ground_truth": ground_truth,
                 }
             )
 
+        # map() keeps results in report order
+        def evaluate(job: Dict[str, Any]) -> Dict[str, Any]:
+            logger.info(f"\nEvaluating report: {job['report_path']}")
+            return self._evaluate_report(
+                job["report_path"], job["artifacts_path"], job["ground_truth"]
+            )
+
+        # Create the shared evaluator up front so workers don't race to build it
+        if pending:
+            get_research_evaluator(self.cache_path)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            evaluations = list(executor.map(evaluate, pending))
+
+        results = [
+            {
+                "query": job["query"],
+                "report_path": job["report_path"],
+                "artifacts_path": job["artifacts_path"],
+                "evaluation": evaluation,
+            }
+            for job, evaluation in zip(pending, evaluations)
+        ]
+
         # Generate evaluation report
         self._generate_evaluation_report(results)
 
@@ -183,8 +254,11 @@ class ExistingEvaluator:
             logger.warning("No evaluations to report on!")
             return
 
-        # Create summary DataFrame
+        # Build one summary row per evaluated report, collecting the values of
+        # the numeric columns as we go so stats don't rescan every column
         summary_data = []
+        numeric_columns: Dict[str, List[Any]] = {}
+        feedback_parts = []
         for result in results:
             eval_data = result["evaluation"]
             row_data = {
@@ -196,50 +270,63 @@ class ExistingEvaluator:
                 "Artifacts Path": result["artifacts_path"],
             }
 
-            # Add additional metrics that are numeric
-            for key, value in eval_data["additional_metrics"].items():
-                if isinstance(value, (int, float)):
-                    row_data[key] = value
+            # Numeric additional metrics go in the table, the rest in feedback
+            additional = eval_data["additional_metrics"]
+            numeric_metrics = {
+                key: value
+                for key, value in additional.items()
+                if is_metric_value(value)
+            }
+            row_data.update(numeric_metrics)
+            feedback_parts.append(f"### {result['query']}\n\n")
+            feedback_parts.extend(
+                f"- {key}: {value}\n"
+                for key, value in additional.items()
+                if not is_metric_value(value)
+            )
+            feedback_parts.append("\n")
+
+            for key in ("Accuracy", "Relevance", "Coherence", *numeric_metrics):
+                numeric_columns.setdefault(key, []).append(row_data[key])
 
             summary_data.append(row_data)
 
-        df = pd.DataFrame(summary_data)
+        # Columns in first-seen order; rows may carry different extra metrics
+        headers = list(dict.fromkeys(key for row in summary_data for key in row))
 
-        # Calculate statistics for numeric columns only
-        numeric_cols = df.select_dtypes(include=["float64", "int64"]).columns
-        stats = {}
-        for col in numeric_cols:
-            stats[f"Mean {col}"] = df[col].mean()
-            stats[f"Best {col}"] = df[col].max()
+        # Calculate statistics for numeric columns only; bool columns such as
+        # passed are collected with the metrics but get no mean or max
+        stats: Dict[str, Any] = {}
+        for col, values in numeric_columns.items():
+            if all(is_numeric(value) for value in values):
+                stats[f"Mean {col}"] = fmean(values)
+                stats[f"Best {col}"] = max(values)
 
-        stats["Total Reports"] = len(df)
+        stats["Total Reports"] = len(summary_data)
+
+        stats_block = "\n".join(
+            f"- {key}: {value:.3f}" if is_numeric(value) else f"- {key}: {value}"
+            for key, value in stats.items()
+        )
 
-        # Save summary report
+        # Save summary report with a single buffered write
         summary_path = self.evaluations_dir / "evaluation_summary.md"
-        with open(summary_path, "w") as f:
-            f.write("# Evaluation Summary\n\n")
-            f.write("## Statistics\n\n")
-            for key, value in stats.items():
-                if isinstance(value, (int, float)):
-                    f.write(f"- {key}: {value:.3f}\n")
-                else:
-                    f.write(f"- {key}: {value}\n")
-
-            f.write("\n## Detailed Results\n\n")
-            f.write(df.to_markdown(index=False))
-
-            # Add non-numeric feedback
-            f.write("\n## Additional Feedback\n\n")
-            for result in results:
-                eval_data = result["evaluation"]
-                f.write(f"### {result['query']}\n\n")
-                for key, value in eval_data["additional_metrics"].items():
-                    if not isinstance(value, (int, float)):
-                        f.write(f"- {key}: {value}\n")
-                f.write("\n")
+        with open(summary_path, "w", buffering=1 << 20) as f:
+            f.write(
+                "# Evaluation Summary\n\n"
+                "## Statistics\n\n"
+                f"{stats_block}\n"
+                "\n## Detailed Results\n\n"
+                f"{markdown_table(headers, summary_data)}"
+                "\n## Additional Feedback\n\n"
+                f"{''.join(feedback_parts)}"
+            )
 
         # Save detailed results as CSV
-        df.to_csv(self.evaluations_dir / "detailed_results.csv", index=False)
+        with open(self.evaluations_dir / "detailed_results.csv", "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=headers)
+            writer.writeheader()
+            writer.writerows(summary_data)
 
         logger.info(f"\nEvaluation summary saved to: {summary_path}")
         logger.info(
@@ -256,9 +343,21 @@ def main():
     )
     parser.add_argument("batch_dir", help="Path to batch output directory")
     parser.add_argument("ground_truth", help="Path to ground truth JSON file")
+    parser.add_argument(
+        "--cache",
+        help="Path to an on-disk cache of evaluation results to reuse across runs",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of reports to evaluate concurrently (default: 8)",
+    )
     args = parser.parse_args()
 
-    evaluator = ExistingEvaluator(args.batch_dir)
+    evaluator = ExistingEvaluator(
+        args.batch_dir, cache_path=args.cache, max_workers=args.workers
+    )
     evaluator.evaluate_reports(args.ground_truth)
 
 
@@ -1,7 +1,7 @@
 import logging
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Optional
 
 from deep_research_agent.evaluations.evaluators.artifact_evaluator import (
     ArtifactEvaluator,
@@ -9,6 +9,7 @@ from deep_research_agent.evaluations.evaluators.artifact_evaluator import (
 from deep_research_agent.evaluations.evaluators.research_evaluator import (
     ResearchEvaluator,
 )
+from deep_research_agent.formatting import format_report_for_evaluation
 
 # Add project root to Python path
 project_root = str(Path(__file__).parent.parent)
@@ -90,30 +91,6 @@ def evaluate_artifacts(
     print(f"Total Citations: {artifacts['metadata']['total_citations']}")
 
 
-def format_report_for_evaluation(report: Dict[str, Any]) -> str:
-    """Format the report for evaluation."""
-    sections = []
-
-    # Add title
-    sections.append(f"# {report['title']}\n")
-
-    # Add each section
-    for section in report["sections"]:
-        sections.append(f"## {section['title']}\n")
-        sections.append(section["content"])
-        if section["key_points"]:
-            sections.append("\nKey Points:")
-            for point in section["key_points"]:
-                sections.append(f"- {point}")
-        if section["citations"]:
-            sections.append("\nCitations:")
-            for citation in section["citations"]:
-                sections.append(f"- {citation['text']}: {citation['reference']}")
-        sections.append("\n")
-
-    return "\n".join(sections)
-
-
 def main():
     """Main function to evaluate research artifacts."""
     import argparse
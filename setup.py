@@ -1,3 +1,5 @@
+import os
+
 from setuptools import find_packages, setup
 
 with open("README.md", "r", encoding="utf-8") as fh:
@@ -8,6 +10,13 @@ with open("requirements.txt", "r", encoding="utf-8") as fh:
         line.strip() for line in fh if line.strip() and not line.startswith("#")
     ]
 
+# Opt-in ahead-of-time compilation of the report formatting hot path
+ext_modules = []
+if os.getenv("DEEP_RESEARCH_MYPYC"):
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["deep_research_agent/formatting.py"])
+
 setup(
     name="deep-research-agent",
     version="0.1.0",
@@ -38,6 +47,7 @@ setup(
             "deep-research=deep_research_agent.cli:main",
         ],
     },
+    ext_modules=ext_modules,
     include_package_data=True,
     package_data={
         "deep_research_agent": ["templates/*.jinja2", "prompts/*.py"],
@@ -0,0 +1,186 @@
+import random
+import re
+import unittest
+
+from deep_research_agent.agents.subagents.citation_agent import CitationAgent
+from deep_research_agent.utils.text_processing import calculate_similarity
+
+_CONTENT = (
+    "Quantum computers use qubits to store information. "
+    "Bananas are a yellow fruit. "
+    "Error correction protects fragile qubits from noise."
+)
+
+_RESULTS = (
+    {
+        "title": "Qubits",
+        "authors": ["Smith"],
+        "year": 2022,
+        "url": "https://example.com/qubits",
+        "content": "Quantum computers use qubits to store information.",
+    },
+    {
+        "title": "Error Correction",
+        "authors": ["Brown", "Lee"],
+        "year": 2024,
+        "url": "https://example.com/errors",
+        "content": "Error correction protects fragile qubits from noise.",
+    },
+)
+
+_WORDS = (
+    "quantum qubits error correction noise fragile computers store information "
+    "research fusion power plasma energy reactor the of and a to"
+).split()
+
+
+def _expected_content(agent, content):
+    """Cite content the way the original sentence-by-sentence loop did."""
+    cited = []
+    for sentence in re.split(r"(?<=[.!?])\s+", content):
+        matching = [
+            citation
+            for citation in agent.citation_db.values()
+            if calculate_similarity(sentence, citation.content)
+            >= agent.similarity_threshold
+        ]
+        if matching:
+            numbers = ",".join(str(i + 1) for i in range(len(matching)))
+            cited.append(f"{sentence} [{numbers}]")
+        else:
+            cited.append(sentence)
+    return " ".join(cited)
+
+
+class TestCitationAgent(unittest.TestCase):
+    def setUp(self):
+        self.agent = CitationAgent()
+
+    def test_matching_sentences_are_cited(self):
+        """Only sentences similar to a source get a citation."""
+        result = self.agent.forward(_CONTENT, list(_RESULTS))
+
+        self.assertEqual(
+            result["content"],
+            "Quantum computers use qubits to store information. [1] "
+            "Bananas are a yellow fruit. "
+            "Error correction protects fragile qubits from noise. [1]",
+        )
+        self.assertEqual(
+            sorted(c.title for c in result["citations"]), ["Error Correction", "Qubits"]
+        )
+        self.assertEqual(result["metadata"]["total_citations"], 2)
+
+    def test_group_numbering(self):
+        """A sentence matching several sources gets one numbered group."""
+        results = [
+            {**_RESULTS[0], "authors": ["Doe"], "year": 2021},
+            {**_RESULTS[0], "authors": ["Roe"], "year": 2023},
+        ]
+
+        result = self.agent.forward(_RESULTS[0]["content"], results)
+
+        self.assertEqual(result["content"], f"{_RESULTS[0]['content']} [1,2]")
+
+    def test_unreferenced_sources_are_left_out(self):
+        results = [*_RESULTS, {**_RESULTS[0], "authors": ["Roe"], "content": "x y"}]
+
+        result = self.agent.forward(_CONTENT, results)
+
+        self.assertNotIn("Roe", " ".join(result["reference_list"]))
+
+    def test_colliding_keys_keep_first_position(self):
+        """A later source with the same author and year replaces the entry
+        but keeps its reference number."""
+        results = [
+            {**_RESULTS[0], "title": "First"},
+            {**_RESULTS[1]},
+            {**_RESULTS[0], "title": "Second", "content": "Other content."},
+        ]
+
+        self.agent.forward("Unrelated.", results)
+
+        self.assertEqual(list(self.agent.citation_db), ["Smith_2022", "Brown_2024"])
+        self.assertEqual(self.agent.citation_db["Smith_2022"].title, "Second")
+        self.assertEqual(
+            self.agent._generate_reference_list(),
+            [
+                '[1] [1] Smith. 2022. "Second." '
+                "[https://example.com/qubits](https://example.com/qubits)",
+                '[2] [2] Brown and Lee. 2024. "Error Correction." '
+                "[https://example.com/errors](https://example.com/errors)",
+            ],
+        )
+
+    def test_reference_list_is_sorted(self):
+        result = self.agent.forward(_CONTENT, list(reversed(_RESULTS)))
+
+        self.assertEqual(result["reference_list"], sorted(result["reference_list"]))
+        self.assertTrue(result["reference_list"][0].startswith("[1] Brown and Lee."))
+
+    def test_invalid_urls_are_dropped(self):
+        results = [
+            {**_RESULTS[0], "url": "ftp://example.com/qubits"},
+            {**_RESULTS[1], "url": ""},
+        ]
+
+        self.agent.forward(_CONTENT, results, citation_style="apa")
+
+        for citation in self.agent.citation_db.values():
+            self.assertEqual(citation.url, "")
+            self.assertTrue(citation.reference.endswith("[No valid URL available]"))
+        self.assertEqual(
+            self.agent.citation_db["Smith_2022"].reference,
+            "[1] Smith. (2022). Qubits. [No valid URL available]",
+        )
+
+    def test_instance_reused_with_different_sources(self):
+        """A second forward() call only cites its own sources."""
+        fusion = {
+            "title": "Fusion",
+            "authors": ["Garcia"],
+            "year": 2020,
+            "url": "https://example.com/fusion",
+            "content": "Fusion reactors confine hot plasma.",
+        }
+        content = "Fusion reactors confine hot plasma. " + _CONTENT
+
+        self.agent.forward(content, list(_RESULTS))
+        reused = self.agent.forward(content, [fusion])
+        fresh = CitationAgent().forward(content, [fusion])
+
+        self.assertEqual(reused["content"], fresh["content"])
+        self.assertEqual(reused["reference_list"], fresh["reference_list"])
+        self.assertEqual([c.title for c in reused["citations"]], ["Fusion"])
+        self.assertEqual(list(self.agent.citation_db), ["Garcia_2020"])
+
+    def test_matches_sentence_by_sentence_similarity(self):
+        """Citations match a plain per-sentence similarity check on varied text."""
+        rng = random.Random(0)
+
+        def sentence():
+            return " ".join(rng.choices(_WORDS, k=rng.randint(3, 8))) + "."
+
+        for _ in range(20):
+            sentences = [sentence() for _ in range(rng.randint(1, 6))]
+            results = [
+                {
+                    "title": f"Source {i}",
+                    "authors": [f"Author {i}"],
+                    "year": rng.randint(2000, 2024),
+                    "url": f"https://example.com/{i}",
+                    "content": rng.choice(sentences)
+                    if rng.random() < 0.5
+                    else sentence(),
+                }
+                for i in range(rng.randint(1, 5))
+            ]
+            content = " ".join(sentences)
+
+            result = self.agent.forward(content, results)
+
+            self.assertEqual(result["content"], _expected_content(self.agent, content))
+
+
+if __name__ == "__main__":
+    unittest.main()
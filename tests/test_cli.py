@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from deep_research_agent import cli
+from deep_research_agent.agents.lead_researcher import ReportSection, ResearchReport
+
+
+class _StubResearcher:
+    """Stand-in for LeadResearcher that records its config and returns a report."""
+
+    configs = []
+
+    def __init__(self, config=None):
+        self.configs.append(config)
+
+    def forward(self, query, strategy):
+        return ResearchReport(
+            title=f"Report on {query}",
+            sections=[
+                ReportSection(
+                    title="Introduction",
+                    content="Introduction content.",
+                    key_points=[],
+                    citations=[],
+                )
+            ],
+            metadata={"query": query, "strategy": strategy},
+        )
+
+
+class TestGenerateReport(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp_dir.name)
+        _StubResearcher.configs.clear()
+        self.researcher_patcher = patch.object(cli, "LeadResearcher", _StubResearcher)
+        self.researcher_patcher.start()
+
+    def tearDown(self):
+        self.researcher_patcher.stop()
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def test_batch_style_args(self):
+        """Args built the way scripts/batch_process.py builds them are accepted."""
+        output = os.path.join(self.tmp_dir.name, "report.md")
+        args = type(
+            "Args",
+            (),
+            {
+                "query": "quantum computing",
+                "mode": "full",
+                "sections": None,
+                "depth": 3,
+                "results": 5,
+                "output": output,
+                "citation_style": "chicago",
+                "citation_threshold": 0.6,
+                "artifacts_dir": os.path.join(self.tmp_dir.name, "artifacts"),
+            },
+        )
+
+        report_path, artifacts_path = cli.generate_report(args)
+
+        self.assertEqual(report_path, output)
+        self.assertTrue(os.path.exists(report_path))
+        self.assertTrue(os.path.exists(artifacts_path))
+        self.assertIsNone(_StubResearcher.configs[0]["citation_cache_path"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import pytest
+
+from deep_research_agent.formatting import (
+    _format_citation,
+    format_report_for_evaluation,
+    is_metric_value,
+    is_numeric,
+    markdown_table,
+)
+
+REFERENCE = {"text": "[1]", "reference": "Doe. 2023. Paper."}
+SOURCE = {"text": "[Doe, 2023]", "source": "https://example.com"}
+TEXT_ONLY = {"text": "[2]"}
+
+
+def _report(citations):
+    return {
+        "title": "Report",
+        "sections": [
+            {
+                "title": "Introduction",
+                "content": "Some content [1].",
+                "key_points": ["Point 1", "Point 2"],
+                "citations": citations,
+            }
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "citations",
+    [
+        [REFERENCE, {"text": "[3]", "reference": "Roe. 2024. Book."}],
+        [REFERENCE, SOURCE, TEXT_ONLY, "Plain citation"],
+        [REFERENCE, "Plain citation"],
+        [REFERENCE, {"text": "[4]"}],
+        [SOURCE, REFERENCE],
+        ["Plain citation", REFERENCE],
+    ],
+    ids=[
+        "references",
+        "mixed",
+        "reference-then-string",
+        "reference-then-text-only",
+        "source-first",
+        "string-first",
+    ],
+)
+def test_citations_match_per_citation_formatting(citations):
+    """The fast path and its fallback format every citation like _format_citation."""
+    expected = "\n".join(_format_citation(c) for c in citations)
+
+    markdown = format_report_for_evaluation(_report(citations))
+
+    assert f"\n\nCitations:\n{expected}\n\n" in markdown
+
+
+def test_format_report_for_evaluation():
+    markdown = format_report_for_evaluation(_report([REFERENCE, SOURCE]))
+
+    assert markdown == (
+        "# Report\n"
+        "\n## Introduction\n\nSome content [1]."
+        "\n\nKey Points:\n- Point 1\n- Point 2"
+        "\n\nCitations:\n- [1]: Doe. 2023. Paper.\n- [Doe, 2023]: https://example.com"
+        "\n\n"
+    )
+
+
+def test_format_report_for_evaluation_without_key_points_or_citations():
+    report = _report([])
+    report["sections"][0]["key_points"] = []
+
+    assert format_report_for_evaluation(report) == (
+        "# Report\n\n## Introduction\n\nSome content [1].\n\n"
+    )
+
+
+def test_markdown_table_escapes_pipes_and_fills_missing_cells():
+    rows = [{"Query": "a | b", "Score": 0.5}, {"Query": "c"}]
+
+    assert markdown_table(["Query", "Score"], rows) == "\n".join(
+        [
+            "| Query | Score |",
+            "|---|---|",
+            "| a \\| b | 0.5 |",
+            "| c |  |",
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "value, numeric, metric",
+    [
+        (1, True, True),
+        (0.5, True, True),
+        (True, False, True),
+        (False, False, True),
+        ("0.5", False, False),
+        (None, False, False),
+    ],
+)
+def test_is_numeric_and_is_metric_value(value, numeric, metric):
+    """Bools are metric values for the table but not numbers for stats."""
+    assert is_numeric(value) is numeric
+    assert is_metric_value(value) is metric
@@ -1,7 +1,8 @@
 import json
 import logging
 import os
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
@@ -12,7 +13,33 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@pytest.fixture(autouse=True)
+class _StubLLM:
+    """Stand-in for genai.GenerativeModel that always returns the same text."""
+
+    __slots__ = ("_response",)
+
+    def __init__(self, text):
+        self._response = SimpleNamespace(text=text)
+
+    def generate_content(self, prompt):
+        return self._response
+
+
+class _StubTavily:
+    """Stand-in for TavilyClient that always returns the same results."""
+
+    __slots__ = ("_response",)
+
+    def __init__(self, response):
+        self._response = response
+
+    def search(self, *args, **kwargs):
+        return self._response
+
+
+# The fixtures below are module-scoped: LeadResearcher is only read by the
+# tests, so one instance (and its patches) is shared by the whole module.
+@pytest.fixture(scope="module", autouse=True)
 def mock_env_vars():
     """Mock environment variables for testing."""
     with patch.dict(
@@ -21,85 +48,83 @@ def mock_env_vars():
         yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_llm():
-    """Create a mock LLM model that returns a realistic JSON string with sections."""
-    mock_model = MagicMock()
-    mock_response = MagicMock()
-    mock_response.text = json.dumps(
-        {
-            "title": "Test Report",
-            "sections": [
-                {
-                    "title": "Introduction",
-                    "content": "This is an introduction with a citation [Smith, J. 2023].",  # noqa
-                    "key_points": ["Point 1"],
-                    "citations": [
-                        {
-                            "id": "cite1",
-                            "text": "Smith, J. (2023). Test Paper",
-                            "url": "https://example.com/paper1",
+    """Create a stub LLM model that returns a realistic JSON string with sections."""
+    return _StubLLM(
+        json.dumps(
+            {
+                "title": "Test Report",
+                "sections": [
+                    {
+                        "title": "Introduction",
+                        "content": "This is an introduction with a citation [Smith, J. 2023].",  # noqa
+                        "key_points": ["Point 1"],
+                        "citations": [
+                            {
+                                "id": "cite1",
+                                "text": "Smith, J. (2023). Test Paper",
+                                "url": "https://example.com/paper1",
+                            }
+                        ],
+                    },
+                    {
+                        "title": "Background",
+                        "content": "Background content.",
+                        "key_points": ["Background Point"],
+                        "citations": [],
+                    },
+                    {
+                        "title": "References",
+                        "content": "This section lists all sources cited in the report.\n\n1. Smith, J. (2023). Test Paper. https://example.com/paper1",  # noqa
+                        "key_points": [],
+                        "citations": [],
+                    },
+                ],
+                "metadata": {
+                    "query": "Test query",
+                    "strategy": {"test_mode": True},
+                    "plan": {
+                        "main_topics": ["Topic 1"],
+                        "subtopics": {"Topic 1": ["Subtopic 1"]},
+                        "key_questions": ["Question 1"],
+                        "required_sources": {"Topic 1": 2},
+                    },
+                    "analyses": {
+                        "Topic 1": {
+                            "main_points": ["Point 1"],
+                            "key_insights": ["Insight 1"],
+                            "technical_details": ["Detail 1"],
+                            "applications": ["Application 1"],
+                            "future_directions": ["Direction 1"],
+                            "confidence_score": 0.9,
                         }
-                    ],
+                    },
                 },
-                {
-                    "title": "Background",
-                    "content": "Background content.",
-                    "key_points": ["Background Point"],
-                    "citations": [],
-                },
-                {
-                    "title": "References",
-                    "content": "This section lists all sources cited in the report.\n\n1. Smith, J. (2023). Test Paper. https://example.com/paper1",  # noqa
-                    "key_points": [],
-                    "citations": [],
-                },
-            ],
-            "metadata": {
-                "query": "Test query",
-                "strategy": {"test_mode": True},
-                "plan": {
-                    "main_topics": ["Topic 1"],
-                    "subtopics": {"Topic 1": ["Subtopic 1"]},
-                    "key_questions": ["Question 1"],
-                    "required_sources": {"Topic 1": 2},
-                },
-                "analyses": {
-                    "Topic 1": {
-                        "main_points": ["Point 1"],
-                        "key_insights": ["Insight 1"],
-                        "technical_details": ["Detail 1"],
-                        "applications": ["Application 1"],
-                        "future_directions": ["Direction 1"],
-                        "confidence_score": 0.9,
-                    }
-                },
-            },
-        }
+            }
+        )
     )
-    mock_model.generate_content.return_value = mock_response
-    return mock_model
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_tavily():
-    """Create a mock Tavily client."""
-    mock_client = MagicMock()
-    mock_client.search.return_value = {
-        "results": [
-            {
-                "title": "Test Result",
-                "url": "https://example.com/test",
-                "content": "Test content",
-                "score": 0.9,
-                "metadata": {"authors": ["Test Author"], "date": "2024-01-01"},
-            }
-        ]
-    }
-    return mock_client
+    """Create a stub Tavily client."""
+    return _StubTavily(
+        {
+            "results": [
+                {
+                    "title": "Test Result",
+                    "url": "https://example.com/test",
+                    "content": "Test content",
+                    "score": 0.9,
+                    "metadata": {"authors": ["Test Author"], "date": "2024-01-01"},
+                }
+            ]
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_config():
     """Test configuration with minimal parameters."""
     return {
@@ -111,7 +136,7 @@ def test_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def lead_researcher(mock_llm, mock_tavily):
     """Create a LeadResearcher instance for testing."""
     with patch(
@@ -121,10 +146,13 @@ def lead_researcher(mock_llm, mock_tavily):
         "deep_research_agent.agents.subagents.web_searcher.TavilyClient",
         return_value=mock_tavily,
     ):
-        return LeadResearcher()
+        # Yield inside the patches so models created during the test (e.g. for
+        # the report title) also get the stub instead of probing for real
+        # Google credentials
+        yield LeadResearcher()
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="module", autouse=True)
 def patch_section_generator():
     """Patch section_generator.forward to return predictable sections for testing."""
 
@@ -162,11 +190,11 @@ def patch_section_generator():
             ),
         )
 
+    # forward is a plain function, so calls skip MagicMock's call bookkeeping
     with patch(
-        "deep_research_agent.agents.lead_researcher.SectionGenerator"
-    ) as MockSectionGen:
-        instance = MockSectionGen.return_value
-        instance.forward.side_effect = fake_forward
+        "deep_research_agent.agents.lead_researcher.SectionGenerator",
+        return_value=SimpleNamespace(forward=fake_forward),
+    ):
         yield
 
 
@@ -263,6 +291,42 @@ def test_report_to_markdown(lead_researcher, test_config):
             ), f"Section {section.title} content not found in markdown"
 
 
+def test_section_citations_follow_cited_text(lead_researcher):
+    """Each section keeps the citations whose markers occur in its cited text."""
+    citations = [
+        {"id": "1", "text": "[1]", "reference": "Ref 1", "url": ""},
+        {"id": "2", "text": "[2]", "reference": "Ref 2", "url": ""},
+        {"id": "11", "text": "[11]", "reference": "Ref 11", "url": ""},
+    ]
+    cited_sections = [
+        "Introduction cites [1] and [11].",
+        "Findings cite the group [1, 2] and [2] twice [2].",
+    ]
+    citation_agent = SimpleNamespace(
+        cite_text=lambda text, sources, style: {
+            "cited_text": "\n\n".join(cited_sections),
+            "references": "[1] Ref 1\n\n[2] Ref 2\n\n[11] Ref 11\n\n",
+            "citations": citations,
+        }
+    )
+    search_results = [{"title": "Result", "url": "https://example.com/a"}]
+    strategy = {"sections": ["Introduction", "Main Findings", "References"]}
+
+    with patch.object(lead_researcher, "citation_agent", citation_agent):
+        report = lead_researcher._generate_report(
+            "Test query", strategy, None, {}, search_results
+        )
+
+    sections = {section.title: section for section in report.sections}
+    for title, text in zip(["Introduction", "Main Findings"], cited_sections):
+        assert sections[title].content == text
+        # Same result as checking each citation marker with `in`
+        assert sections[title].citations == [c for c in citations if c["text"] in text]
+    assert [c["text"] for c in sections["Introduction"].citations] == ["[1]", "[11]"]
+    assert [c["text"] for c in sections["Main Findings"].citations] == ["[2]"]
+    assert sections["References"].citations == citations
+
+
 if __name__ == "__main__":
     # Run tests directly
     test_config2 = {
@@ -1,15 +1,52 @@
+import os
+import re
+import tempfile
 import unittest
-from unittest.mock import Mock
-
-import google.generativeai as genai
+from types import SimpleNamespace
 
 from deep_research_agent.agents.subagents.llm_citation_agent import LLMCitationAgent
 
+# Bracketed in-text citations, e.g. [1] or [Smith, Jones, 2023]
+_CITATION_RE = re.compile(r"\[[^\]]+\]")
+
+# Sources shared by every test; cite_text only reads them
+_SOURCES = (
+    {
+        "authors": ("Smith", "Jones"),
+        "year": 2023,
+        "title": "Advances in Quantum Computing",
+        "url": "https://example.com/quantum",
+    },
+    {
+        "authors": ("Brown",),
+        "year": 2024,
+        "title": "Quantum Error Correction",
+        "url": "https://example.com/error",
+    },
+)
+
+
+class _StubLLM:
+    """Stand-in for genai.GenerativeModel that returns a canned response."""
+
+    __slots__ = ("response", "error", "call_count")
+
+    def __init__(self):
+        self.response = None
+        self.error = None
+        self.call_count = 0
+
+    def generate_content(self, prompt):
+        self.call_count += 1
+        if self.error is not None:
+            raise self.error
+        return self.response
+
 
 class TestLLMCitationAgent(unittest.TestCase):
     def setUp(self):
-        # Mock the LLM
-        self.mock_llm = Mock(spec=genai.GenerativeModel)
+        # Stub the LLM
+        self.mock_llm = _StubLLM()
         self.agent = LLMCitationAgent(self.mock_llm, citation_style="chicago")
 
         # Sample test data
@@ -19,20 +56,7 @@ class TestLLMCitationAgent(unittest.TestCase):
         New algorithms are being developed for practical applications.
         """
 
-        self.test_sources = [
-            {
-                "authors": ["Smith", "Jones"],
-                "year": 2023,
-                "title": "Advances in Quantum Computing",
-                "url": "https://example.com/quantum",
-            },
-            {
-                "authors": ["Brown"],
-                "year": 2024,
-                "title": "Quantum Error Correction",
-                "url": "https://example.com/error",
-            },
-        ]
+        self.test_sources = _SOURCES
 
     def test_initialization(self):
         """Test that the agent initializes correctly."""
@@ -42,8 +66,8 @@ class TestLLMCitationAgent(unittest.TestCase):
     def test_cite_text_basic(self):
         """Test basic citation functionality."""
         # Mock LLM response
-        mock_response = Mock()
-        mock_response.text = """
+        mock_response = SimpleNamespace(
+            text="""
         Quantum computing has made significant progress in recent years
         [Smith, Jones, 2023].
         Researchers have achieved breakthroughs in qubit stability and error correction
@@ -55,7 +79,8 @@ class TestLLMCitationAgent(unittest.TestCase):
         https://example.com/quantum
         Brown. 2024. "Quantum Error Correction." https://example.com/error
         """
-        self.mock_llm.generate_content.return_value = mock_response
+        )
+        self.mock_llm.response = mock_response
 
         # Call the method
         result = self.agent.cite_text(self.test_text, self.test_sources)
@@ -65,19 +90,21 @@ class TestLLMCitationAgent(unittest.TestCase):
         self.assertIn("references", result)
         self.assertIn("citations", result)
         self.assertIsNotNone(result["references"])
+        self.assertRegex(result["cited_text"], _CITATION_RE)
 
     def test_cite_text_no_references_section(self):
         """Test handling of LLM response without References section."""
         # Mock LLM response without References section
-        mock_response = Mock()
-        mock_response.text = """
+        mock_response = SimpleNamespace(
+            text="""
         Quantum computing has made significant progress in recent years
         [Smith, Jones, 2023].
         Researchers have achieved breakthroughs in qubit stability and error correction
         [Brown, 2024].
         New algorithms are being developed for practical applications.
         """
-        self.mock_llm.generate_content.return_value = mock_response
+        )
+        self.mock_llm.response = mock_response
 
         # Call the method
         result = self.agent.cite_text(self.test_text, self.test_sources)
@@ -88,7 +115,7 @@ class TestLLMCitationAgent(unittest.TestCase):
     def test_cite_text_llm_error(self):
         """Test handling of LLM errors."""
         # Mock LLM error
-        self.mock_llm.generate_content.side_effect = Exception("LLM error")
+        self.mock_llm.error = Exception("LLM error")
 
         # Verify that the error is propagated
         with self.assertRaises(Exception):
@@ -103,13 +130,42 @@ class TestLLMCitationAgent(unittest.TestCase):
         """
 
         # Mock LLM response
-        mock_response = Mock()
-        mock_response.text = text_with_citations
-        self.mock_llm.generate_content.return_value = mock_response
+        mock_response = SimpleNamespace(text=text_with_citations)
+        self.mock_llm.response = mock_response
 
         # Call the method
         _ = self.agent.cite_text(text_with_citations, self.test_sources)
 
+    def test_cached_response_is_reused(self):
+        """A repeated prompt is served from the cache, even across instances."""
+        mock_response = SimpleNamespace(
+            text="Quantum computing has made progress [1].\n\n## References"
+        )
+        self.mock_llm.response = mock_response
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, "citations")
+            first = LLMCitationAgent(self.mock_llm, cache_path=cache_path).cite_text(
+                self.test_text, self.test_sources
+            )
+            second = LLMCitationAgent(self.mock_llm, cache_path=cache_path).cite_text(
+                self.test_text, self.test_sources, style="apa"
+            )
+
+        self.assertEqual(first["cited_text"], second["cited_text"])
+        self.assertIn("(2023)", second["references"])
+        self.assertEqual(self.mock_llm.call_count, 1)
+
+    def test_cache_disabled_by_default(self):
+        """Without a cache path every call goes to the LLM."""
+        mock_response = SimpleNamespace(text="Quantum computing has made progress [1].")
+        self.mock_llm.response = mock_response
+
+        self.agent.cite_text(self.test_text, self.test_sources)
+        self.agent.cite_text(self.test_text, self.test_sources)
+
+        self.assertEqual(self.mock_llm.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,209 +1,70 @@
+import copy
 import json
+import re
 import unittest
-from contextlib import ExitStack
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 
+from deep_research_agent.agents import lead_researcher
 from deep_research_agent.agents.lead_researcher import LeadResearcher, ReportSection
+from deep_research_agent.agents.subagents import web_searcher
 
+# Canned LLM responses, loaded once at import and frozen against mutation
+_RESPONSES = MappingProxyType(
+    json.loads(
+        (Path(__file__).parent / "fixtures" / "pipeline_responses.json").read_text()
+    )
+)
 
-class TestPipeline(unittest.TestCase):
-    def setUp(self):
-        """Set up the test environment with mock dependencies."""
-        # Create mock responses for different stages
-        self.mock_responses = {
-            "plan": {
-                "main_topics": ["Quantum Computing Basics", "Recent Developments"],
-                "subtopics": {
-                    "Quantum Computing Basics": ["Qubits", "Superposition"],
-                    "Recent Developments": ["Error Correction", "Quantum Supremacy"],
-                },
-                "key_questions": [
-                    "What are the latest breakthroughs?",
-                    "How close are we to practical applications?",
-                ],
-                "required_sources": {
-                    "Quantum Computing Basics": 2,
-                    "Recent Developments": 3,
-                },
-            },
-            "analysis": {
-                "main_points": [
-                    "Quantum computing uses qubits",
-                    "Recent breakthroughs in error correction",
-                ],
-                "key_insights": [
-                    "Quantum supremacy achieved",
-                    "Practical applications emerging",
-                ],
-                "technical_details": [
-                    "Qubit coherence times improving",
-                    "Error correction codes advancing",
-                ],
-                "applications": ["Cryptography", "Drug discovery"],
-                "future_directions": [
-                    "Fault-tolerant quantum computers",
-                    "Quantum internet",
-                ],
-                "confidence_score": 0.9,
-            },
-            "review": {
-                "strengths": [
-                    "Clear explanation of basics",
-                    "Good coverage of recent developments",
-                ],
-                "weaknesses": [
-                    "Could use more examples",
-                    "Technical details could be deeper",
-                ],
-                "missing_elements": ["More examples", "Deeper technical details"],
-                "suggestions": [
-                    "Add more real-world examples",
-                    "Include more technical details",
-                ],
-                "confidence_score": 0.85,
-                "priority_fixes": ["Add more examples", "Deepen technical details"],
-            },
-            "section": {
-                "title": "Introduction",
-                "content": "Quantum computing represents a revolutionary approach to computation, leveraging the principles of quantum mechanics to process information in fundamentally new ways. Recent developments have brought us closer to practical applications, with significant breakthroughs in error correction and quantum supremacy demonstrations.",  # noqa
-                "key_points": [
-                    "Quantum computing basics",
-                    "Recent breakthroughs",
-                    "Future potential",
-                ],
-                "citations": [
-                    {
-                        "key": "smith2023",
-                        "text": "Smith et al. (2023)",
-                        "reference": "Smith, J., et al. (2023). Quantum Computing Advances. Nature, 123(4), 567-589.",  # noqa
-                        "url": "https://example.com/smith2023",
-                    },
-                    {
-                        "key": "jones2021",
-                        "text": "Jones (2021)",
-                        "reference": "Jones, R. (2021). The Future of Quantum Computing. Science, 456(7), 890-912.",  # noqa
-                        "url": "https://example.com/jones2021",
-                    },
-                ],
-            },
-            "references": {
-                "title": "References",
-                "content": "1. Smith, J., et al. (2023). Quantum Computing Advances. Nature, 123(4), 567-589.\n2. Jones, R. (2021). The Future of Quantum Computing. Science, 456(7), 890-912.",  # noqa
-                "key_points": [],
-                "citations": [
-                    {
-                        "key": "smith2023",
-                        "text": "Smith et al. (2023)",
-                        "reference": "Smith, J., et al. (2023). Quantum Computing Advances. Nature, 123(4), 567-589.",  # noqa
-                        "url": "https://example.com/smith2023",
-                    },
-                    {
-                        "key": "jones2021",
-                        "text": "Jones (2021)",
-                        "reference": "Jones, R. (2021). The Future of Quantum Computing. Science, 456(7), 890-912.",  # noqa
-                        "url": "https://example.com/jones2021",
-                    },
-                ],
-            },
-        }
-
-        # Create a mock model that returns different responses based on the prompt
-        self.mock_model = MagicMock()
-
-        def mock_generate_content(prompt):
-            response = MagicMock()
-            if "research plan" in prompt.lower():
-                response.text = json.dumps(self.mock_responses["plan"])
-            elif "content analysis" in prompt.lower():
-                response.text = json.dumps(
-                    {
-                        "main_points": [
-                            "Quantum computing uses qubits",
-                            "Recent breakthroughs in error correction",
-                        ],
-                        "key_insights": [
-                            "Quantum supremacy achieved",
-                            "Practical applications emerging",
-                        ],
-                        "technical_details": [
-                            "Qubit coherence times improving",
-                            "Error correction codes advancing",
-                        ],
-                        "applications": ["Cryptography", "Drug discovery"],
-                        "future_directions": [
-                            "Fault-tolerant quantum computers",
-                            "Quantum internet",
-                        ],
-                        "confidence_score": 0.9,
-                        "citations": [],
-                    }
-                )
-            elif "review" in prompt.lower():
-                response.text = json.dumps(self.mock_responses["review"])
-            elif "references" in prompt.lower():
-                response.text = json.dumps(self.mock_responses["references"])
-            else:
-                response.text = json.dumps(
-                    self.mock_responses["section"]
-                )  # Default response
-            return response
+# (prompt keyword, response key) pairs, checked in order; other prompts get a section
+_PROMPT_ROUTES = (
+    ("research plan", "plan"),
+    ("content analysis", "analysis"),
+    ("review", "review"),
+    ("references", "references"),
+)
 
-        self.mock_model.generate_content.side_effect = mock_generate_content
+# Bracketed or parenthetical in-text citations, e.g. [Doe, 2023] or (Doe, 2023)
+_CITATION_RE = re.compile(r"\[[^\]]+\]|\([^)]+\)")
 
-        # Create a mock web search response
-        self.mock_search_response = {
-            "results": [
-                {
-                    "title": "Quantum Computing Basics",
-                    "url": "https://example.com/quantum-basics",
-                    "content": "An introduction to quantum computing concepts.",
-                },
-                {
-                    "title": "Recent Developments in Quantum Computing",
-                    "url": "https://example.com/quantum-developments",
-                    "content": "Latest breakthroughs in quantum computing technology.",
-                },
-            ]
-        }
 
-        # Create patches for all external dependencies
-        self.patches = {
-            "llm": patch(
-                "deep_research_agent.agents.lead_researcher.genai.GenerativeModel"
-            ),
-            "web_searcher": patch(
-                "deep_research_agent.agents.subagents.web_searcher.WebSearcher"
-            ),
-            "tavily": patch(
-                "deep_research_agent.agents.subagents.web_searcher.TavilyClient"
-            ),
-            "reviewer": patch(
-                "deep_research_agent.agents.subagents.reviewer_agent.ReviewerAgent"
-            ),
-            "section_generator": patch(
-                "deep_research_agent.agents.lead_researcher.SectionGenerator"
-            ),
-            "citation_agent": patch(
-                "deep_research_agent.agents.subagents.citation_agent.CitationAgent"
-            ),
+class TestPipeline(unittest.TestCase):
+    """Run the full pipeline against class-scoped stubs.
+
+    The stubs and the LeadResearcher are built once in setUpClass. The stubs are
+    plain objects with no call history, so there is no mock state to reset
+    between tests.
+    """
+
+    # Mock responses for different stages; shared by every test, so read-only
+    mock_responses = _RESPONSES
+
+    @classmethod
+    def setUpClass(cls):
+        """Stub out the external dependencies once for the whole class."""
+        # Encode each canned response once; the pipeline only reads .text
+        responses = {
+            key: SimpleNamespace(text=json.dumps(value))
+            for key, value in cls.mock_responses.items()
         }
+        responses["analysis"] = SimpleNamespace(
+            text=json.dumps({**cls.mock_responses["analysis"], "citations": []})
+        )
 
-        # Use ExitStack to manage all patches as a context manager
-        self.exit_stack = ExitStack()
-        self.mocks = {}
-        for name, patcher in self.patches.items():
-            self.mocks[name] = self.exit_stack.enter_context(patcher)
+        # Create a stub model that returns different responses based on the prompt
+        def mock_generate_content(prompt):
+            prompt_lower = prompt.lower()
+            for keyword, key in _PROMPT_ROUTES:
+                if keyword in prompt_lower:
+                    return responses[key]
+            return responses["section"]  # Default response
 
-        # Configure the mocks
-        self.mocks["llm"].return_value = self.mock_model
-        self.mocks[
-            "web_searcher"
-        ].return_value.search.return_value = self.mock_search_response
+        cls.mock_model = SimpleNamespace(generate_content=mock_generate_content)
 
         # Mock the section generator
-        def mock_section_generator(topic, analysis, section_type=None):
+        def build_section(section_type):
             if section_type == "References":
-                return ReportSection(**self.mock_responses["references"])
+                return ReportSection(**cls.mock_responses["references"])
             return ReportSection(
                 title=section_type or "Introduction",
                 content=f"Content for {section_type or 'Introduction'} [Doe, 2023]",
@@ -211,27 +72,56 @@ class TestPipeline(unittest.TestCase):
                 citations=[{"text": "[Doe, 2023]"}],
             )
 
-        self.mocks[
-            "section_generator"
-        ].return_value.forward.side_effect = mock_section_generator
+        # Each section type is built once; the pipeline rewrites the content
+        # of the sections it gets back, so it is handed shallow copies
+        sections = {}
 
-        # Mock the citation agent
-        def mock_citation_agent(content, search_results, citation_style=None):
-            return {
-                "content": content,
-                "citations": self.mock_responses["section"]["citations"],
-            }
+        def mock_section_generator(topic, analysis, section_type=None):
+            section = sections.get(section_type)
+            if section is None:
+                section = sections[section_type] = build_section(section_type)
+            return copy.copy(section)
+
+        # Replace the external dependencies with plain stubs; direct
+        # rebinding is much cheaper than patch() and needs no MagicMock
+        section_generator = SimpleNamespace(forward=mock_section_generator)
+        cls._replace(
+            lead_researcher.genai,
+            "GenerativeModel",
+            lambda *args, **kwargs: cls.mock_model,
+        )
+        # The real WebSearcher built by LeadResearcher gets no Tavily results
+        tavily = SimpleNamespace(search=lambda *args, **kwargs: {"results": []})
+        cls._replace(web_searcher, "TavilyClient", lambda *args, **kwargs: tavily)
+        cls._replace(
+            lead_researcher,
+            "SectionGenerator",
+            lambda *args, **kwargs: section_generator,
+        )
+
+        # One LeadResearcher, built on the stubs, is shared by every test
+        cls.lead_researcher = LeadResearcher()
+
+        # Reports of earlier pipeline runs, see _run_pipeline()
+        cls._reports = {}
+        cls.addClassCleanup(cls._reports.clear)
 
-        self.mocks[
-            "citation_agent"
-        ].return_value.forward.side_effect = mock_citation_agent
+    @classmethod
+    def _replace(cls, module, name, value):
+        """Rebind module.name to value until the class is done."""
+        cls.addClassCleanup(setattr, module, name, getattr(module, name))
+        setattr(module, name, value)
 
-        # Initialize the lead researcher inside the patch context
-        self.lead_researcher = LeadResearcher()
+    def _run_pipeline(self, query, strategy):
+        """Run the pipeline, reusing the report of an identical earlier run.
 
-    def tearDown(self):
-        """Clean up after the test."""
-        self.exit_stack.close()
+        The stubbed pipeline is deterministic, so tests sharing a query and
+        strategy share one report and must treat it as read-only.
+        """
+        key = (query, json.dumps(strategy, sort_keys=True))
+        if key not in self._reports:
+            self._reports[key] = self.lead_researcher.forward(query, strategy)
+        return self._reports[key]
 
     def test_full_pipeline(self):
         """Test the full research pipeline with a real-world query."""
@@ -254,10 +144,21 @@ class TestPipeline(unittest.TestCase):
         }
 
         # Run the pipeline
-        report = self.lead_researcher.forward(query, strategy)
+        report = self._run_pipeline(query, strategy)
+
+        # Collect titles, empty sections and citations in one pass
+        section_titles = []
+        empty_sections = []
+        has_citations = False
+        for section in report.sections:
+            section_titles.append(section.title)
+            if not section.content:
+                empty_sections.append(section.title)
+            elif not has_citations and _CITATION_RE.search(section.content):
+                has_citations = True
 
         # Diagnostic prints
-        print("Report sections:", [section.title for section in report.sections])
+        print("Report sections:", section_titles)
         print("Report object:", report)
 
         # Basic structure checks
@@ -266,21 +167,13 @@ class TestPipeline(unittest.TestCase):
         self.assertTrue(len(report.sections) > 0)
 
         # Check for essential sections
-        section_titles = [section.title for section in report.sections]
         self.assertIn("Introduction", section_titles)
         self.assertIn("References", section_titles)
 
         # Check that sections have content
-        for section in report.sections:
-            self.assertTrue(
-                len(section.content) > 0, f"Section {section.title} has no content"
-            )
+        self.assertFalse(empty_sections, f"Sections with no content: {empty_sections}")
 
         # Check for citations in the content
-        has_citations = any(
-            "[" in section.content or "(" in section.content
-            for section in report.sections
-        )
         self.assertTrue(has_citations, "No citations found in the report")
 
         # Check metadata
@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from deep_research_agent.evaluations.evaluators.research_evaluator import (
+    ResearchEvaluator,
+)
+
+
+class TestResearchEvaluatorCache(unittest.TestCase):
+    def setUp(self):
+        self.model_patcher = patch(
+            "deep_research_agent.evaluations.evaluators.research_evaluator"
+            ".genai.GenerativeModel"
+        )
+        self.mock_model = self.model_patcher.start().return_value
+        response = MagicMock()
+        response.text = json.dumps(
+            {
+                "factual_accuracy": 0.8,
+                "citation_accuracy": 0.7,
+                "completeness": 0.6,
+                "source_quality": 0.5,
+                "tool_efficiency": 0.4,
+                "overall_score": 0.7,
+                "passed": True,
+                "feedback": ["Well cited"],
+                "confidence": 0.9,
+            }
+        )
+        self.mock_model.generate_content.return_value = response
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp_dir.name, "evaluations")
+
+    def tearDown(self):
+        self.model_patcher.stop()
+        self.tmp_dir.cleanup()
+
+    def test_cached_result_is_reused(self):
+        """A repeated evaluation is served from the cache, even across instances."""
+        first = ResearchEvaluator({"cache_path": self.cache_path}).evaluate(
+            "Report text", ground_truth="Expected"
+        )
+        second = ResearchEvaluator({"cache_path": self.cache_path}).evaluate(
+            "Report text", ground_truth="Expected"
+        )
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.mock_model.generate_content.call_count, 1)
+
+    def test_changed_input_misses_cache(self):
+        """A different report is evaluated again."""
+        evaluator = ResearchEvaluator({"cache_path": self.cache_path})
+        evaluator.evaluate("Report text")
+        evaluator.evaluate("Another report")
+
+        self.assertEqual(self.mock_model.generate_content.call_count, 2)
+
+    def test_errors_are_not_cached(self):
+        """Failed evaluations are retried on the next call."""
+        self.mock_model.generate_content.side_effect = Exception("LLM error")
+        evaluator = ResearchEvaluator({"cache_path": self.cache_path})
+
+        result = evaluator.evaluate("Report text")
+        self.assertIn("error", result.additional_metrics)
+
+        evaluator.evaluate("Report text")
+        self.assertEqual(self.mock_model.generate_content.call_count, 2)
+
+    def test_cache_disabled_by_default(self):
+        """Without a cache path every call goes to the LLM."""
+        evaluator = ResearchEvaluator()
+        evaluator.evaluate("Report text")
+        evaluator.evaluate("Report text")
+
+        self.assertEqual(self.mock_model.generate_content.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
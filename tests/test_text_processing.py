@@ -0,0 +1,63 @@
+import pytest
+
+from deep_research_agent.utils.text_processing import (
+    MARKER_SCAN_THRESHOLD,
+    marker_scanner,
+)
+
+TEXTS = [
+    "Qubits are fragile [1]. Error correction helps [11].",
+    "Grouped citations [1, 2] are not single markers.",
+    "Repeated [2] markers [2] are found once [2].",
+    "No citations here.",
+    "",
+]
+
+
+def _expected(markers, text):
+    """The per-marker substring check marker_scanner replaces."""
+    return {m for m in markers if m in text}
+
+
+@pytest.mark.parametrize(
+    "markers",
+    [
+        ["[1]", "[2]", "[11]", "[2]"],
+        [f"[{i}]" for i in range(1, MARKER_SCAN_THRESHOLD + 10)] + ["[2]"],
+    ],
+    ids=["substring-checks", "compiled-pattern"],
+)
+@pytest.mark.parametrize("text", TEXTS)
+def test_marker_scanner_matches_substring_checks(markers, text):
+    """Both branches find the same markers as checking each one with `in`."""
+    assert marker_scanner(markers)(text) == _expected(markers, text)
+
+
+@pytest.mark.parametrize(
+    "markers",
+    [
+        ["[1]", "[11]"],
+        [f"[{i}]" for i in range(1, MARKER_SCAN_THRESHOLD + 10)],
+    ],
+    ids=["substring-checks", "compiled-pattern"],
+)
+def test_marker_scanner_distinguishes_markers(markers):
+    """[1] is not found inside [11] or inside the group [1, 2]."""
+    find = marker_scanner(markers)
+
+    assert find("See [11].") == {"[11]"}
+    assert find("See [1, 2].") == set()
+    assert find("See [1] and [1] and [11].") == {"[1]", "[11]"}
+
+
+@pytest.mark.parametrize(
+    "markers",
+    [["", "[1]"], [""] + [f"[{i}]" for i in range(1, MARKER_SCAN_THRESHOLD + 10)]],
+    ids=["substring-checks", "compiled-pattern"],
+)
+def test_marker_scanner_finds_empty_marker_everywhere(markers):
+    """Like `"" in text`, an empty marker is found in every text."""
+    find = marker_scanner(markers)
+
+    assert find("Text [1]") == {"", "[1]"}
+    assert find("") == {""}
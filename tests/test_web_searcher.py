@@ -4,54 +4,89 @@ from unittest.mock import patch
 
 from deep_research_agent.agents.subagents.web_searcher import WebSearcher
 
+# Tavily API response with valid and invalid URLs; the searcher only reads it
+_MOCK_MIXED = {
+    "results": [
+        {
+            "title": "Valid URL Article",
+            "url": "https://example.com/valid",
+            "content": "Valid content.",
+            "score": 0.9,
+            "metadata": {"authors": ["John Doe"], "date": "2023-05-15"},
+        },
+        {
+            "title": "Invalid URL Article",
+            "url": "not-a-valid-url",
+            "content": "Invalid URL content.",
+            "score": 0.8,
+            "metadata": {
+                "author": "Jane Smith",
+                "published_date": "2022-12-01",
+            },
+        },
+        {
+            "title": "No URL Article",
+            "content": "No URL content.",
+            "score": 0.7,
+            "metadata": {},
+        },
+    ],
+    "answer": None,  # Add this to match the expected response structure
+}
+
+# Tavily API response with empty content
+_MOCK_EMPTY_CONTENT = {
+    "results": [
+        {
+            "title": "Empty Content Article",
+            "url": "https://example.com/empty",
+            "content": "",
+            "score": 0.5,
+            "metadata": {"authors": ["Nobody"]},
+        }
+    ]
+}
+
+
+class _StubTavily:
+    """Stand-in for TavilyClient that returns a canned response."""
+
+    __slots__ = ("response",)
+
+    def __init__(self):
+        self.response = None
+
+    def search(self, *args, **kwargs):
+        return self.response
+
 
 class TestWebSearcher(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         # Patch TavilyClient at the correct import path before instantiating WebSearcher
-        self.tavily_patcher = patch(
-            "deep_research_agent.agents.subagents.web_searcher.TavilyClient"
+        # The client is a plain stub, so searches skip Mock call tracking
+        cls.tavily_patcher = patch(
+            "deep_research_agent.agents.subagents.web_searcher.TavilyClient",
+            return_value=_StubTavily(),
         )
-        self.mock_tavily = self.tavily_patcher.start()
-        # Mock the TAVILY_API_KEY environment variable
-        self.env_patcher = patch.dict(os.environ, {"TAVILY_API_KEY": "test_key"})
-        self.env_patcher.start()
-        self.searcher = WebSearcher()
+        cls.tavily_patcher.start()
+        cls.addClassCleanup(cls.tavily_patcher.stop)
+        # Set the TAVILY_API_KEY environment variable, restoring it afterwards
+        old_key = os.environ.get("TAVILY_API_KEY")
+        os.environ["TAVILY_API_KEY"] = "test_key"
+        if old_key is None:
+            cls.addClassCleanup(os.environ.pop, "TAVILY_API_KEY", None)
+        else:
+            cls.addClassCleanup(os.environ.__setitem__, "TAVILY_API_KEY", old_key)
+        # One searcher is shared by the class; setUp clears its Tavily response
+        cls.searcher = WebSearcher()
 
-    def tearDown(self):
-        self.tavily_patcher.stop()
-        self.env_patcher.stop()
+    def setUp(self):
+        self.searcher.tavily_client.response = None
 
     def test_metadata_extraction_and_url_validation(self):
         # Mock Tavily API response with valid and invalid URLs
-        mock_response = {
-            "results": [
-                {
-                    "title": "Valid URL Article",
-                    "url": "https://example.com/valid",
-                    "content": "Valid content.",
-                    "score": 0.9,
-                    "metadata": {"authors": ["John Doe"], "date": "2023-05-15"},
-                },
-                {
-                    "title": "Invalid URL Article",
-                    "url": "not-a-valid-url",
-                    "content": "Invalid URL content.",
-                    "score": 0.8,
-                    "metadata": {
-                        "author": "Jane Smith",
-                        "published_date": "2022-12-01",
-                    },
-                },
-                {
-                    "title": "No URL Article",
-                    "content": "No URL content.",
-                    "score": 0.7,
-                    "metadata": {},
-                },
-            ],
-            "answer": None,  # Add this to match the expected response structure
-        }
-        self.searcher.tavily_client.search.return_value = mock_response
+        self.searcher.tavily_client.response = _MOCK_MIXED
         results = self.searcher.forward("test query", max_results=3, search_depth=1)
         processed_results = results.get("results", [])
         print("Processed result titles:", [r["title"] for r in processed_results])
@@ -73,18 +108,7 @@ class TestWebSearcher(unittest.TestCase):
 
     def test_content_filtering(self):
         # Mock Tavily API response with empty content
-        mock_response = {
-            "results": [
-                {
-                    "title": "Empty Content Article",
-                    "url": "https://example.com/empty",
-                    "content": "",
-                    "score": 0.5,
-                    "metadata": {"authors": ["Nobody"]},
-                }
-            ]
-        }
-        self.searcher.tavily_client.search.return_value = mock_response
+        self.searcher.tavily_client.response = _MOCK_EMPTY_CONTENT
         results = self.searcher.forward("test query", max_results=1)
         processed_results = results.get("results", [])
         self.assertEqual(len(processed_results), 0)  # Should filter out empty content